@@ -8,6 +8,7 @@ from pathlib import Path
 
 from .config import Settings
 from .health import ScraperHealthMonitor
+from .live_fetch import build_http_client
 from .providers import (
     FinancesBJProvider,
     ProviderDescriptor,
@@ -34,7 +35,7 @@ async def initialise_providers(
     registry_state: RegistryState,
     health_monitor: ScraperHealthMonitor,
 ) -> ProviderRegistry:
-    registry = ProviderRegistry()
+    registry = ProviderRegistry(http_client=build_http_client(settings))
 
     for provider_id in settings.enabled_providers:
         if provider_id == ServicePublicBJProvider.provider_id:
@@ -42,6 +43,7 @@ async def initialise_providers(
                 settings,
                 registry_state=registry_state,
                 health_monitor=health_monitor,
+                http_client=registry.http_client,
             )
             descriptor = ProviderDescriptor(
                 id=provider.provider_id,
@@ -85,6 +87,7 @@ async def initialise_providers(
                 settings,
                 registry_state=registry_state,
                 health_monitor=health_monitor,
+                http_client=registry.http_client,
             )
             descriptor = ProviderDescriptor(
                 id=provider.provider_id,
@@ -133,12 +136,13 @@ async def initialise_providers(
 
 async def shutdown_providers(registry: ProviderRegistry) -> None:
     tasks = [provider.shutdown() for provider in registry.all()]
-    if not tasks:
-        return
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    for result in results:
-        if isinstance(result, asyncio.CancelledError):
-            logger.debug("Provider shutdown cancelled; ignoring.")
-            continue
-        if isinstance(result, Exception):
-            logger.warning("Provider shutdown raised an exception: %s", result, exc_info=result)
+    if tasks:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                logger.debug("Provider shutdown cancelled; ignoring.")
+                continue
+            if isinstance(result, Exception):
+                logger.warning("Provider shutdown raised an exception: %s", result, exc_info=result)
+    if registry.http_client is not None:
+        await registry.http_client.aclose()
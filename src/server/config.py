@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import AnyHttpUrl, Field, field_validator
+from pydantic import AliasChoices, AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -53,6 +53,14 @@ class Settings(BaseSettings):
         ge=0,
         description="Global cache TTL (seconds) for live responses.",
     )
+    response_cache_size: int = Field(
+        default=256,
+        alias="SP_RESPONSE_CACHE_SIZE",
+        # env_prefix does not apply to aliases; accept the documented MCP_ name too.
+        validation_alias=AliasChoices("SP_RESPONSE_CACHE_SIZE", "MCP_SP_RESPONSE_CACHE_SIZE"),
+        ge=0,
+        description="Maximum number of tool responses kept in memory (0 disables; entries expire after SP_CACHE_TTL).",
+    )
     user_agent: str = Field(
         default="MCP-Service-Public-BJ/0.1",
         alias="SP_USER_AGENT",
@@ -13,6 +13,20 @@ from .config import Settings
 from .health import ScraperHealthMonitor
 from .metrics import record_fetch
 
+# One pool serves every provider, so keep-alive connections outlive individual calls.
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def build_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create an HTTP client suitable for sharing between provider fetchers."""
+
+    return httpx.AsyncClient(
+        timeout=settings.timeout_seconds,
+        headers={"User-Agent": settings.user_agent},
+        limits=HTTP_POOL_LIMITS,
+        http2=True,
+    )
+
 
 class LiveFetchClient:
     """Handles HTTP requests with caching, concurrency limits, and metrics."""
@@ -24,24 +38,25 @@ class LiveFetchClient:
         base_url: str,
         provider_id: str,
         monitor: ScraperHealthMonitor | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._settings = settings
         self._base_url = base_url.rstrip("/") + "/"
         self._provider_id = provider_id
         self._monitor = monitor
         self._semaphore = asyncio.Semaphore(settings.concurrency)
-        self._client = httpx.AsyncClient(
-            timeout=settings.timeout_seconds,
-            headers={"User-Agent": settings.user_agent},
-        )
+        # A client passed in is shared and closed by its owner, not by this fetcher.
+        self._owns_client = client is None
+        self._client = client if client is not None else build_http_client(settings)
         self._cache: Cache | None = None
         if settings.cache_ttl_seconds > 0:
             self._cache = Cache(Cache.MEMORY, ttl=settings.cache_ttl_seconds)
 
     async def close(self) -> None:
-        """Close underlying HTTP client and cache."""
+        """Close the HTTP client (unless shared) and cache."""
 
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
         if self._cache:
             await self._cache.close()
 
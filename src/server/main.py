@@ -11,6 +11,7 @@ from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
 from typing import Any
 
+import orjson
 import uvicorn
 from mcp import types
 from mcp.server.lowlevel import server as lowlevel_server
@@ -25,8 +26,10 @@ from .bootstrap import initialise_providers, load_registry_state, shutdown_provi
 from .config import Settings, get_settings
 from .health import ScraperHealthMonitor
 from .metrics import metrics_payload, record_http_request
+from .persistence import PersistScheduler
 from .providers import ProviderRegistry
 from .registry import RegistryState, RegistryStore
+from .response_cache import ToolResponseCache
 from .schemas import (
     GET_SERVICE_DETAILS_INPUT_SCHEMA,
     GET_SERVICE_DETAILS_OUTPUT_SCHEMA,
@@ -117,6 +120,12 @@ class MCPServerRuntime:
         self._persist_lock = Lock()
         self._shutdown_lock = Lock()
         self._is_shutdown = False
+        # Tools only mark the registry dirty; writes happen off the request path.
+        self._persist_scheduler = PersistScheduler(self.persist_state)
+        self.response_cache = ToolResponseCache(
+            maxsize=settings.response_cache_size,
+            ttl_seconds=settings.cache_ttl_seconds,
+        )
 
         self._tool_definitions = _build_tool_definitions()
         self._app = self._build_low_level_app()
@@ -159,7 +168,8 @@ class MCPServerRuntime:
                 provider_id=arguments.get("provider_id"),
                 parent_id=arguments.get("parent_id"),
                 refresh=bool(arguments.get("refresh", False)),
-                persist_state=self.persist_state,
+                persist_state=self._persist_scheduler.request_flush,
+                response_cache=self.response_cache,
             )
 
         async def handle_search_services(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -172,7 +182,8 @@ class MCPServerRuntime:
                 limit=_coerce_optional_int(arguments.get("limit")),
                 offset=int(arguments.get("offset", 0)),
                 refresh=bool(arguments.get("refresh", False)),
-                persist_state=self.persist_state,
+                persist_state=self._persist_scheduler.request_flush,
+                response_cache=self.response_cache,
             )
 
         async def handle_get_details(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -182,7 +193,7 @@ class MCPServerRuntime:
                 provider_id=arguments.get("provider_id"),
                 service_id=arguments["service_id"],
                 refresh=bool(arguments.get("refresh", False)),
-                persist_state=self.persist_state,
+                persist_state=self._persist_scheduler.request_flush,
             )
 
         async def handle_validate_service(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -191,7 +202,7 @@ class MCPServerRuntime:
                 self.registry_state,
                 provider_id=arguments.get("provider_id"),
                 service_id=arguments["service_id"],
-                persist_state=self.persist_state,
+                persist_state=self._persist_scheduler.request_flush,
             )
 
         async def handle_get_status(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -211,17 +222,26 @@ class MCPServerRuntime:
         }
 
         @app.call_tool()
-        async def _call_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        async def _call_tool(
+            tool_name: str, arguments: dict[str, Any]
+        ) -> tuple[list[types.TextContent], dict[str, Any]]:
             handler = tool_handlers.get(tool_name)
             if handler is None:
                 raise ValueError(f"Unknown tool '{tool_name}'")
-            return await handler(arguments or {})
+            payload = await handler(arguments or {})
+            # Encode the text mirror ourselves: orjson is much cheaper than the SDK's
+            # default json.dumps(indent=2) and payloads are already JSON-native.
+            text = orjson.dumps(payload).decode()
+            return [types.TextContent(type="text", text=text)], payload
 
         return app
 
     async def persist_state(self) -> None:
         async with self._persist_lock:
-            await asyncio.to_thread(self._registry_store.save, self.registry_state)
+            # Tool calls mutate the catalogs on the loop, so encode here and hand the
+            # worker thread only the finished bytes.
+            data = RegistryStore.encode(self.registry_state)
+            await asyncio.to_thread(self._registry_store.write, data)
 
     async def run_session(self, read_stream: Any, write_stream: Any) -> None:
         await self._app.run(
@@ -243,6 +263,7 @@ class MCPServerRuntime:
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("Provider shutdown raised an exception: %s", exc, exc_info=exc)
         try:
+            await self._persist_scheduler.close()
             await self.persist_state()
         except asyncio.CancelledError:
             logger.debug("Persist state cancelled; cache may be partially written.")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from collections import deque
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -23,6 +24,11 @@ _FETCH_LATENCY_SECONDS: Histogram
 _HTTP_REQUEST_COUNTER: Counter
 _HTTP_REQUEST_LATENCY_SECONDS: Histogram
 
+# Tool invocations are buffered and applied to the collectors in batches. deque
+# appends/pops are atomic, so recording never takes a lock on the request path.
+_TOOL_INVOCATION_BUFFER: deque[tuple[str, str, float | None]] = deque()
+_TOOL_INVOCATION_FLUSH_THRESHOLD = 256
+
 
 def _initialise_registry() -> None:
     global _REGISTRY
@@ -79,12 +85,41 @@ def _ensure_registry() -> None:
                 _initialise_registry()
 
 
-def record_tool_invocation(tool: str, status: str, duration_seconds: float) -> None:
-    """Record a tool invocation."""
+def record_tool_invocation(tool: str, status: str, duration_seconds: float | None) -> None:
+    """Record a tool invocation (buffered until the next flush); ``None`` only counts it."""
+
+    _TOOL_INVOCATION_BUFFER.append((tool, status, duration_seconds))
+    if len(_TOOL_INVOCATION_BUFFER) >= _TOOL_INVOCATION_FLUSH_THRESHOLD:
+        flush_tool_invocations()
+
+
+def flush_tool_invocations() -> None:
+    """Apply buffered tool invocations to the Prometheus collectors.
+
+    Invocations are grouped first so each label set is resolved (and its counter
+    incremented) once per flush rather than once per invocation.
+    """
 
     _ensure_registry()
-    _TOOL_CALL_COUNTER.labels(tool=tool, status=status).inc()
-    _TOOL_LATENCY_SECONDS.labels(tool=tool).observe(duration_seconds)
+    calls: dict[tuple[str, str], int] = {}
+    durations: dict[str, list[float]] = {}
+    pop = _TOOL_INVOCATION_BUFFER.popleft
+    while _TOOL_INVOCATION_BUFFER:
+        try:
+            tool, status, duration_seconds = pop()
+        except IndexError:  # pragma: no cover - drained by another thread
+            break
+        key = (tool, status)
+        calls[key] = calls.get(key, 0) + 1
+        if duration_seconds is not None:
+            durations.setdefault(tool, []).append(duration_seconds)
+
+    for (tool, status), count in calls.items():
+        _TOOL_CALL_COUNTER.labels(tool=tool, status=status).inc(count)
+    for tool, samples in durations.items():
+        histogram = _TOOL_LATENCY_SECONDS.labels(tool=tool)
+        for duration_seconds in samples:
+            histogram.observe(duration_seconds)
 
 
 def record_fetch(provider: str, *, cache_hit: bool, outcome: str, duration_seconds: float) -> None:
@@ -116,12 +151,18 @@ def record_http_request(
 def metrics_payload() -> tuple[bytes, str]:
     """Return the Prometheus metrics payload and content type."""
 
-    _ensure_registry()
+    flush_tool_invocations()
     return generate_latest(_REGISTRY or CollectorRegistry()), CONTENT_TYPE_LATEST
 
 
 def reset_metrics_for_tests() -> None:  # pragma: no cover - test utility
-    """Reset the registry so tests can run with a clean state."""
+    """Reset the registry so tests can run with a clean state.
+
+    The old registry is simply dropped; the next recording builds a fresh one.
+    """
+
+    global _REGISTRY
 
     with _LOCK:
-        _initialise_registry()
+        _TOOL_INVOCATION_BUFFER.clear()
+        _REGISTRY = None
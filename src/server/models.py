@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import weakref
 from datetime import datetime
+from typing import Any
 
 from pydantic import AnyHttpUrl, BaseModel, Field
 
@@ -75,3 +77,28 @@ class ServiceDetails(ServiceSummary):
     processing_time: str | None = None
     contacts: list[ContactPoint] = Field(default_factory=list)
     external_links: list[DocumentLink] = Field(default_factory=list)
+
+
+# JSON dumps keyed by id(model); the weakref both guards against id reuse and evicts
+# the entry once the model is garbage-collected. Models are unhashable, which rules
+# out a WeakKeyDictionary.
+_JSON_DUMPS: dict[int, tuple[weakref.ref[BaseModel], dict[str, Any]]] = {}
+
+
+def dump_model_json(model: BaseModel) -> dict[str, Any]:
+    """Return ``model.model_dump(mode="json")``, computed once per model instance.
+
+    Catalog models are treated as immutable once built, so the returned dict is shared
+    between callers and must not be mutated.
+    """
+
+    key = id(model)
+    entry = _JSON_DUMPS.get(key)
+    if entry is not None and entry[0]() is model:
+        return entry[1]
+    payload = model.model_dump(mode="json")
+    _JSON_DUMPS[key] = (
+        weakref.ref(model, lambda _ref, key=key: _JSON_DUMPS.pop(key, None)),
+        payload,
+    )
+    return payload
@@ -0,0 +1,72 @@
+"""Background persistence of registry state off the tool request path."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+logger = logging.getLogger(__name__)
+
+
+class PersistScheduler:
+    """Coalesce persist requests into a single background flush.
+
+    ``request_flush`` only marks the state dirty and returns; a worker task waits for the
+    mark, lets a short debounce window absorb further requests, then runs one persist
+    for all of them.
+    """
+
+    def __init__(
+        self,
+        persist: Callable[[], Awaitable[None]],
+        *,
+        debounce_seconds: float = 0.05,
+    ) -> None:
+        self._persist = persist
+        self._debounce = debounce_seconds
+        self._requested = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._flushing = False
+        self._closed = False
+
+    @property
+    def pending(self) -> bool:
+        return self._requested.is_set()
+
+    async def request_flush(self) -> None:
+        if self._closed:
+            await self._persist()
+            return
+        self._requested.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="registry-persist")
+
+    async def _run(self) -> None:
+        while not self._closed:
+            await self._requested.wait()
+            if self._debounce > 0:
+                await asyncio.sleep(self._debounce)
+            self._requested.clear()
+            self._flushing = True
+            try:
+                await self._persist()
+            except Exception as exc:  # pragma: no cover - best effort persistence
+                logger.warning("Background registry persist failed: %s", exc, exc_info=exc)
+            finally:
+                self._flushing = False
+
+    async def close(self) -> None:
+        """Stop the worker, letting an in-flight persist finish first.
+
+        Requests still pending afterwards are left to the caller's final persist.
+        """
+        self._closed = True
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        if not self._flushing:
+            worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from ..config import Settings
@@ -18,6 +19,8 @@ except ImportError:  # pragma: no cover
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
+    import httpx
+
     from ..models import Category, ServiceDetails, ServiceSummary
 
 
@@ -39,6 +42,29 @@ class ProviderDescriptor:
     priority: int = 0
     coverage_tags: tuple[str, ...] = field(default_factory=tuple)
     supported_tools: tuple[str, ...] = field(default_factory=tuple)
+    coverage_tags_folded: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Case-folded once here, like queries, so routing does not re-fold tags per call.
+        object.__setattr__(
+            self, "coverage_tags_folded", tuple(tag.casefold() for tag in self.coverage_tags)
+        )
+
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """JSON-ready view of the descriptor, built once and shared between responses.
+
+        Callers must treat the returned dict as read-only.
+        """
+
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "priority": self.priority,
+            "coverage_tags": list(self.coverage_tags),
+            "supported_tools": list(self.supported_tools),
+        }
 
 
 class BaseProvider(ABC):
@@ -105,9 +131,27 @@ class BaseProvider(ABC):
 class ProviderRegistry:
     """In-memory registry of provider instances keyed by identifier."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, http_client: httpx.AsyncClient | None = None) -> None:
+        # Connection pool shared by the registered providers; closed on shutdown.
+        self.http_client = http_client
         self._providers: dict[str, BaseProvider] = {}
         self._descriptors: dict[str, ProviderDescriptor] = {}
+        self._generation = 0
+        self._resolved: dict[str | None, tuple[tuple[BaseProvider, ProviderDescriptor], ...]] = {}
+        self._coverage_tags: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+        self._ordered: tuple[ProviderDescriptor, ...] | None = None
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the set of registered providers changes."""
+
+        return self._generation
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+        self._resolved.clear()
+        self._coverage_tags = None
+        self._ordered = None
 
     def register(self, provider: BaseProvider, descriptor: ProviderDescriptor) -> None:
         if provider.provider_id in self._providers:
@@ -120,6 +164,7 @@ class ProviderRegistry:
             )
         self._providers[provider.provider_id] = provider
         self._descriptors[provider.provider_id] = descriptor
+        self._invalidate()
 
     def get(self, provider_id: str) -> BaseProvider:
         try:
@@ -139,13 +184,60 @@ class ProviderRegistry:
     def descriptors(self) -> Iterable[ProviderDescriptor]:
         return self._descriptors.values()
 
-    def ordered_descriptors(self) -> list[ProviderDescriptor]:
-        return sorted(
-            self._descriptors.values(),
-            key=lambda descriptor: descriptor.priority,
-            reverse=True,
-        )
+    def ordered_descriptors(self) -> tuple[ProviderDescriptor, ...]:
+        """Return descriptors by descending priority, sorted once per generation."""
+
+        if self._ordered is None:
+            self._ordered = tuple(
+                sorted(
+                    self._descriptors.values(),
+                    key=lambda descriptor: descriptor.priority,
+                    reverse=True,
+                )
+            )
+        return self._ordered
+
+    def resolve(
+        self, provider_id: str | None = None
+    ) -> tuple[tuple[BaseProvider, ProviderDescriptor], ...]:
+        """Return ``(provider, descriptor)`` pairs to try, memoised per generation.
+
+        An explicit ``provider_id`` resolves to that provider only; otherwise all
+        providers are returned in priority order.
+        """
+
+        cached = self._resolved.get(provider_id)
+        if cached is not None:
+            return cached
+        if provider_id:
+            resolved = ((self.get(provider_id), self.get_descriptor(provider_id)),)
+        else:
+            resolved = tuple(
+                (self._providers[descriptor.id], descriptor)
+                for descriptor in self.ordered_descriptors()
+            )
+        self._resolved[provider_id] = resolved
+        return resolved
+
+    def coverage_tag_index(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return all case-folded coverage tags and, in parallel, their descriptor ids.
+
+        The flat layout lets routing score every tag in a single batched rapidfuzz call.
+        """
+
+        if self._coverage_tags is None:
+            pairs = [
+                (tag, descriptor.id)
+                for descriptor in self._descriptors.values()
+                for tag in descriptor.coverage_tags_folded
+            ]
+            self._coverage_tags = (
+                tuple(tag for tag, _ in pairs),
+                tuple(owner for _, owner in pairs),
+            )
+        return self._coverage_tags
 
     def clear(self) -> None:
         self._providers.clear()
         self._descriptors.clear()
+        self._invalidate()
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlencode
 
+import httpx
 from parsel import Selector
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -17,7 +18,6 @@ from ..health import ScraperHealthMonitor
 from ..live_fetch import LiveFetchClient
 from ..models import Category, ContactPoint, DocumentLink, ServiceDetails, ServiceSummary
 from ..registry import RegistryState
-from ..search import ServiceSearchIndex
 from ..selectors import normalise_whitespace
 from .base import BaseProvider
 
@@ -63,6 +63,7 @@ class FinancesBJProvider(BaseProvider):
         *,
         registry_state: RegistryState | None = None,
         health_monitor: ScraperHealthMonitor | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         super().__init__(settings)
         self._health_monitor = health_monitor
@@ -72,9 +73,9 @@ class FinancesBJProvider(BaseProvider):
             base_url=str(settings.finances_base_url),
             provider_id=self.provider_id,
             monitor=health_monitor,
+            client=http_client,
         )
         self._endpoints = FinancesEndpoints()
-        self._search_index = ServiceSearchIndex(self._registry_state, self.provider_id)
         self._last_category_source = "live"
         self._last_search_source = "live"
         self._last_detail_source = "live"
@@ -261,7 +262,6 @@ class FinancesBJProvider(BaseProvider):
 
         if results:
             self._registry_state.update_services(self.provider_id, results, replace=False)
-            self._search_index.rebuild()
         self._last_search_source = "live"
         if total_results is None:
             total_results = offset + len(results)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from collections.abc import Sequence
@@ -11,6 +10,8 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import urlencode
 
+import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..config import Settings
@@ -26,7 +27,6 @@ from ..models import (
     Step,
 )
 from ..registry import RegistryState, SelectorProfile
-from ..search import ServiceSearchIndex
 from ..selectors import normalise_whitespace
 from .base import BaseProvider, ProviderError
 
@@ -54,6 +54,7 @@ class ServicePublicBJProvider(BaseProvider):
         *,
         registry_state: RegistryState | None = None,
         health_monitor: ScraperHealthMonitor | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         super().__init__(settings)
         self._health_monitor = health_monitor
@@ -63,8 +64,8 @@ class ServicePublicBJProvider(BaseProvider):
             base_url=str(settings.base_url),
             provider_id=self.provider_id,
             monitor=health_monitor,
+            client=http_client,
         )
-        self._search_index = ServiceSearchIndex(self._registry_state, self.provider_id)
         self._endpoints = ServicePublicEndpoints()
         self._portal_type = "portal"
         self._last_category_source = "live"
@@ -89,7 +90,7 @@ class ServicePublicBJProvider(BaseProvider):
             query = urlencode(params, doseq=True)
             url = f"{url}?{query}"
         text = await self._fetcher.fetch_text(url, use_cache=use_cache)
-        return json.loads(text)
+        return orjson.loads(text)
 
     def _category_url(self, slug: str) -> str:
         base = str(self.settings.base_url).rstrip("/")
@@ -180,7 +181,6 @@ class ServicePublicBJProvider(BaseProvider):
 
         if results:
             self._registry_state.update_services(self.provider_id, results, replace=False)
-            self._search_index.rebuild()
         self._last_search_source = "live"
         self._last_search_total = len(services)
         return results
@@ -310,7 +310,6 @@ class ServicePublicBJProvider(BaseProvider):
                 },
             ),
         )
-        self._search_index.rebuild()
         self._last_detail_source = "live"
         return details
 
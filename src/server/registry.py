@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from collections.abc import MutableMapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .models import Category, ServiceDetails, ServiceSummary
+import orjson
+
+from .models import Category, ServiceDetails, ServiceSummary, dump_model_json
+
+if TYPE_CHECKING:
+    from .search import ServiceSearchIndex
 
 
 @dataclass
@@ -35,6 +40,9 @@ class ProviderCatalog:
     services_by_category: MutableMapping[str, list[str]] = field(
         default_factory=lambda: defaultdict(list)
     )
+    # Bumped on every service update so derived structures (search index) can detect
+    # staleness without rescanning the catalog.
+    services_version: int = 0
 
     def update_categories(self, categories: Sequence[Category], *, replace: bool = True) -> None:
         if replace:
@@ -61,6 +69,7 @@ class ProviderCatalog:
         for service in self.services.values():
             for category_id in service.category_ids:
                 self.services_by_category[category_id].append(service.id)
+        self.services_version += 1
 
     def set_service_details(self, detail: ServiceDetails) -> None:
         self.service_details[detail.id] = detail
@@ -71,15 +80,10 @@ class ProviderCatalog:
     def to_dict(self) -> dict[str, object]:
         return {
             "provider_id": self.provider_id,
-            "categories": [
-                category.model_dump(mode="json") for category in self.categories.values()
-            ],
-            "services": [
-                service.model_dump(mode="json") for service in self.services.values()
-            ],
+            "categories": [dump_model_json(category) for category in self.categories.values()],
+            "services": [dump_model_json(service) for service in self.services.values()],
             "service_details": [
-                detail.model_dump(mode="json")
-                for detail in self.service_details.values()
+                dump_model_json(detail) for detail in self.service_details.values()
             ],
             "selector_profiles": [
                 {
@@ -126,12 +130,30 @@ class RegistryState:
 
     def __init__(self) -> None:
         self.catalogs: dict[str, ProviderCatalog] = {}
+        self._search_indexes: dict[str, ServiceSearchIndex] = {}
 
     def ensure_catalog(self, provider_id: str) -> ProviderCatalog:
         if provider_id not in self.catalogs:
             self.catalogs[provider_id] = ProviderCatalog(provider_id=provider_id)
         return self.catalogs[provider_id]
 
+    def search_index(self, provider_id: str) -> ServiceSearchIndex:
+        """Return the provider's search index, rebuilt first if its catalog changed.
+
+        Call this on the event loop: the returned index only reads its own snapshot,
+        so it can then be searched from a worker thread.
+        """
+
+        index = self._search_indexes.get(provider_id)
+        if index is None:
+            from .search import ServiceSearchIndex
+
+            index = ServiceSearchIndex(self, provider_id)
+            self._search_indexes[provider_id] = index
+        else:
+            index.ensure_current()
+        return index
+
     def update_categories(
         self, provider_id: str, categories: Sequence[Category], *, replace: bool = True
     ) -> None:
@@ -203,14 +225,26 @@ class RegistryStore:
     def __init__(self, snapshot_path: Path) -> None:
         self._path = snapshot_path
 
+    @staticmethod
+    def encode(state: RegistryState) -> bytes:
+        """Serialise ``state`` to the snapshot's UTF-8 JSON form."""
+
+        return orjson.dumps(state.to_dict(), option=orjson.OPT_INDENT_2)
+
+    @staticmethod
+    def decode(data: bytes) -> RegistryState:
+        return RegistryState.from_dict(orjson.loads(data))
+
     def load(self) -> RegistryState | None:
         if not self._path.exists():
             return None
-        with self._path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
-        return RegistryState.from_dict(payload)
+        return self.decode(self._path.read_bytes())
+
+    def write(self, data: bytes) -> None:
+        """Write a snapshot already produced by :meth:`encode`."""
 
-    def save(self, state: RegistryState) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("w", encoding="utf-8") as handle:
-            json.dump(state.to_dict(), handle, ensure_ascii=False, indent=2)
+        self._path.write_bytes(data)
+
+    def save(self, state: RegistryState) -> None:
+        self.write(self.encode(state))
@@ -0,0 +1,57 @@
+"""Bounded TTL cache for tool payloads keyed by normalised arguments."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class ToolResponseCache:
+    """LRU cache of tool payloads whose entries expire after a fixed TTL.
+
+    Tool handlers run on a single event loop and never await between a lookup and a
+    store, so no locking is required.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0 and self._ttl > 0
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: Hashable, payload: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (self._clock() + self._ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,19 +3,52 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from itertools import chain
 
 from rapidfuzz import fuzz
+from rapidfuzz.distance import Indel
 
 from .models import ServiceSummary
-from .registry import RegistryState
-from .selectors import normalise_whitespace
+from .registry import ProviderCatalog, RegistryState
 
 TOKEN_PATTERN = re.compile(r"[^\w]+", re.UNICODE)
+FALLBACK_MIN_SCORE = 40
+
+# Token postings and the services they point at, as of the last rebuild.
+_IndexSnapshot = tuple[Mapping[str, frozenset[str]], Mapping[str, ServiceSummary]]
+
+
+# Maps every ASCII character that TOKEN_PATTERN treats as a separator to a space.
+_PUNCT_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")}
+)
 
 
 def _tokenise(text: str) -> list[str]:
-    cleaned = TOKEN_PATTERN.sub(" ", normalise_whitespace(text).lower())
-    return [token for token in cleaned.split(" ") if token]
+    if text.isascii():
+        return text.lower().translate(_PUNCT_TABLE).split()
+    # TOKEN_PATTERN already folds whitespace runs into separators.
+    return TOKEN_PATTERN.sub(" ", text.lower()).split()
+
+
+def _fuzzy_score(query: str, title: str, *, score_cutoff: float = 0) -> float:
+    """Score ``query`` against ``title`` (both lowercased) on a 0-100 scale.
+
+    Titles of comparable length are scored with the bit-parallel Indel similarity;
+    the sliding-window ``partial_ratio`` is only used when the title is much longer
+    than the query and a plain alignment would under-rate a substring match.
+    Exact substrings short-circuit to 100, which is what ``partial_ratio`` returns.
+    """
+
+    if query in title:
+        return 100.0
+    if len(title) > 2 * len(query):
+        return fuzz.partial_ratio(query, title, score_cutoff=score_cutoff)
+    score = Indel.normalized_similarity(query, title) * 100
+    return score if score >= score_cutoff else 0.0
 
 
 class ServiceSearchIndex:
@@ -24,53 +57,90 @@ class ServiceSearchIndex:
     def __init__(self, registry: RegistryState, provider_id: str) -> None:
         self._registry = registry
         self._provider_id = provider_id
-        self._index: dict[str, set[str]] = {}
+        self._snapshot: _IndexSnapshot = ({}, {})
+        # Catalog and services_version the snapshot was built from; compared by identity
+        # and integer, never by walking the catalog.
+        self._indexed_catalog: ProviderCatalog | None = None
+        self._indexed_version = -1
         self.rebuild()
 
     def rebuild(self) -> None:
         catalog = self._registry.ensure_catalog(self._provider_id)
-        self._index.clear()
-        for service in catalog.services.values():
+        version = catalog.services_version
+        # Copy the catalog: searches may run in a worker thread while the event loop
+        # replaces catalog.services, so they must never touch the live dict.
+        services = dict(catalog.services)
+        postings: dict[str, set[str]] = {}
+        for service in services.values():
             tokens = set(_tokenise(service.title))
             if service.excerpt:
                 tokens.update(_tokenise(service.excerpt))
+            # Interned ids let every posting share one string object.
+            service_id = sys.intern(service.id)
             for token in tokens:
-                self._index.setdefault(token, set()).add(service.id)
+                postings.setdefault(token, set()).add(service_id)
+        index = {token: frozenset(ids) for token, ids in postings.items()}
+        # Swap in the finished snapshot in one assignment so a concurrent search sees
+        # either the old catalog or the new one, never a mix.
+        self._snapshot = (index, services)
+        self._indexed_catalog = catalog
+        self._indexed_version = version
+
+    def ensure_current(self) -> None:
+        """Rebuild if the catalog changed since the last build; call on the event loop."""
+
+        catalog = self._registry.ensure_catalog(self._provider_id)
+        stale = catalog is not self._indexed_catalog
+        if stale or catalog.services_version != self._indexed_version:
+            self.rebuild()
 
     def search(self, query: str, limit: int = 10) -> list[ServiceSummary]:
+        return [
+            service.model_copy(update={"score": score})
+            for service, score in self.search_with_scores(query, limit)
+        ]
+
+    def search_with_scores(self, query: str, limit: int = 10) -> list[tuple[ServiceSummary, float]]:
+        """Return ``(service, score)`` pairs without cloning the catalog models.
+
+        Only reads the snapshot taken by the last rebuild, so it is safe to run off the
+        event loop; ``RegistryState.search_index`` refreshes it before returning it.
+        """
+
         if not query.strip():
             return []
 
-        catalog = self._registry.ensure_catalog(self._provider_id)
-        tokens = _tokenise(query)
-        candidates: dict[str, int] = {}
-        for token in tokens:
-            for service_id in self._index.get(token, set()):
-                candidates[service_id] = candidates.get(service_id, 0) + 1
+        postings, services = self._snapshot
+        candidates = Counter(
+            chain.from_iterable(postings.get(token, ()) for token in _tokenise(query))
+        )
 
+        query_lower = query.lower()
         scored: list[tuple[float, ServiceSummary]] = []
         if candidates:
             for service_id, count in candidates.items():
-                service = catalog.services.get(service_id)
+                service = services.get(service_id)
                 if not service:
                     continue
-                fuzzy = fuzz.partial_ratio(query.lower(), service.title.lower())
+                fuzzy = _fuzzy_score(query_lower, service.title.lower())
                 score = count * 10 + fuzzy
                 scored.append((score, service))
         else:
-            for service in catalog.services.values():
-                fuzzy = fuzz.partial_ratio(query.lower(), service.title.lower())
-                if fuzzy >= 40:
+            for service in services.values():
+                fuzzy = _fuzzy_score(
+                    query_lower, service.title.lower(), score_cutoff=FALLBACK_MIN_SCORE
+                )
+                if fuzzy >= FALLBACK_MIN_SCORE:
                     scored.append((float(fuzzy), service))
 
         scored.sort(key=lambda item: item[0], reverse=True)
-        results: list[ServiceSummary] = []
+        results: list[tuple[ServiceSummary, float]] = []
         seen = set()
         for score, service in scored:
             if service.id in seen:
                 continue
             seen.add(service.id)
-            results.append(service.model_copy(update={"score": float(score)}))
+            results.append((service, float(score)))
             if len(results) >= limit:
                 break
         return results
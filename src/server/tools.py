@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import time
-from collections.abc import Awaitable, Callable, Iterable
+import asyncio
+import os
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from time import perf_counter_ns
 from typing import Any
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from .metrics import record_tool_invocation
+from .models import ServiceSummary, dump_model_json
 from .providers import (
     BaseProvider,
     ProviderDescriptor,
@@ -16,9 +23,52 @@ from .providers import (
     ProviderRegistry,
 )
 from .registry import RegistryState
+from .response_cache import ToolResponseCache
 from .search import ServiceSearchIndex
 
 PersistCallable = Callable[[], Awaitable[None]] | None
+# (provider_id, detail) pairs; only formatted if the warnings reach a payload.
+ProviderWarnings = list[tuple[str, object]]
+
+# Providers whose coverage tags match the query at least this well are tried first.
+_COVERAGE_MATCH_SCORE = 60
+
+# Number of candidate providers queried at once when a tool falls through providers.
+_FANOUT_WIDTH = 2
+# The next candidate is only started early if the current one is still running after
+# this long; fast answers never cost a second upstream call.
+_HEDGE_DELAY_SECONDS = 1.0
+
+# Cache fallback searches are CPU-bound; cap them at one worker per core so bursts
+# queue up instead of oversubscribing threads.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, os.cpu_count() or 4),
+    thread_name_prefix="mcp-search",
+)
+
+# Searches currently being served, keyed like the response cache plus the registry.
+_IN_FLIGHT: dict[Hashable, asyncio.Future[dict[str, Any]]] = {}
+
+
+class _ToolTimer:
+    """Record a tool invocation's status and latency when the block exits."""
+
+    __slots__ = ("_start", "_tool")
+
+    def __init__(self, tool: str) -> None:
+        self._tool = tool
+        self._start = 0
+
+    def __enter__(self) -> _ToolTimer:
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        # A cancelled speculative call was neither served nor failed; leave it out.
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            return
+        status = "success" if exc_type is None else "error"
+        record_tool_invocation(self._tool, status, (perf_counter_ns() - self._start) / 1e9)
 
 
 async def _persist(persist_state: PersistCallable) -> None:
@@ -27,59 +77,210 @@ async def _persist(persist_state: PersistCallable) -> None:
     await persist_state()
 
 
+@lru_cache(maxsize=1024)
+def _normalize_query(query: str) -> str:
+    # casefold() also folds forms lower() keeps apart (e.g. "ß" and "ss").
+    return query.strip().casefold()
+
+
+async def _search_index_offloaded(
+    index: ServiceSearchIndex, query: str, limit: int
+) -> list[tuple[ServiceSummary, float]]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _SEARCH_EXECUTOR, index.search_with_scores, query, limit
+    )
+
+
 def _provider_candidates(
     registry: ProviderRegistry,
     provider_id: str | None,
     *,
     query: str | None = None,
 ) -> Iterable[tuple[BaseProvider, ProviderDescriptor]]:
-    if provider_id:
-        provider = registry.get(provider_id)
-        descriptor = registry.get_descriptor(provider_id)
-        yield provider, descriptor
-        return
+    candidates = registry.resolve(provider_id)
+    # Coverage scoring only reorders candidates; with a pinned provider, no query or
+    # a single registered provider, hand back the memoised tuple as is.
+    if provider_id or not query or len(candidates) < 2:
+        return candidates
+    return _ranked_candidates(registry, candidates, query)
 
-    descriptors = list(registry.ordered_descriptors())
-    if query:
-        query_normalized = query.lower()
 
-        def coverage_score(descriptor: ProviderDescriptor) -> int:
-            scores = [
-                fuzz.partial_ratio(query_normalized, tag.lower())
-                for tag in descriptor.coverage_tags
-            ]
-            return max(scores) if scores else 0
+def _ranked_candidates(
+    registry: ProviderRegistry,
+    candidates: tuple[tuple[BaseProvider, ProviderDescriptor], ...],
+    query: str,
+) -> Iterable[tuple[BaseProvider, ProviderDescriptor]]:
+    query_normalized = _normalize_query(query)
+    tags, owners = registry.coverage_tag_index()
+    scores = dict.fromkeys((descriptor.id for _, descriptor in candidates), 0.0)
+    # Tags scoring under the cutoff are skipped by rapidfuzz and stay at 0, so weak
+    # matches fall back to plain priority ordering.
+    for _, score, index in process.extract_iter(
+        query_normalized, tags, scorer=fuzz.WRatio, score_cutoff=_COVERAGE_MATCH_SCORE
+    ):
+        owner = owners[index]
+        if score > scores[owner]:
+            scores[owner] = score
+
+    # Build each candidate's sort key exactly once; max() and sorted() below only read it.
+    keys = {
+        descriptor.id: (scores[descriptor.id], descriptor.priority)
+        for _, descriptor in candidates
+    }
+
+    def rank(item: tuple[BaseProvider, ProviderDescriptor]) -> tuple[float, int]:
+        return keys[item[1].id]
+
+    # Most calls stop at the first provider, so pick it in one pass and only order the
+    # remaining candidates if the caller falls back.
+    best = max(candidates, key=rank)
+    yield best
+    yield from sorted(
+        (item for item in candidates if item is not best), key=rank, reverse=True
+    )
+
+
+def _discard(task: asyncio.Future[dict[str, Any]]) -> None:
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        # Retrieve the outcome so an unused failure is not reported as unhandled.
+        task.exception()
+
+
+async def _first_populated(
+    candidates: Iterable[tuple[BaseProvider, ProviderDescriptor]],
+    call: Callable[[BaseProvider], Awaitable[dict[str, Any]]],
+    *,
+    items_key: str,
+    concurrent: bool,
+) -> tuple[dict[str, Any] | None, bool, ProviderWarnings]:
+    """Return the first payload with non-empty ``items_key``, else the last, and whether found."""
+    warnings: ProviderWarnings = []
+    last_payload: dict[str, Any] | None = None
+    remaining = iter(candidates)
+    lookahead: deque[tuple[BaseProvider, asyncio.Future[dict[str, Any]]]] = deque()
+    loop = asyncio.get_running_loop()
+
+    def start_lookahead() -> None:
+        while len(lookahead) < _FANOUT_WIDTH - 1:
+            candidate = next(remaining, None)
+            if candidate is None:
+                break
+            lookahead.append((candidate[0], asyncio.ensure_future(call(candidate[0]))))
+
+    try:
+        while True:
+            current: Awaitable[dict[str, Any]]
+            if lookahead:
+                provider, current = lookahead.popleft()
+            else:
+                candidate = next(remaining, None)
+                if candidate is None:
+                    break
+                provider = candidate[0]
+                # The head of the queue runs inline; only lookahead calls become tasks.
+                current = call(provider)
+            hedge = None
+            # Callers pass concurrent=False for refreshes: those write through to the
+            # registry, so they must stay in priority order.
+            if concurrent and len(lookahead) < _FANOUT_WIDTH - 1:
+                hedge = loop.call_later(_HEDGE_DELAY_SECONDS, start_lookahead)
+
+            try:
+                payload = await current
+            except Exception as exc:  # pragma: no cover - provider error, try next
+                warnings.append((provider.provider_id, exc))
+                continue
+            finally:
+                if hedge is not None:
+                    hedge.cancel()
+
+            if payload[items_key]:
+                return payload, True, warnings
+
+            warnings.append((provider.provider_id, f"no {items_key} returned"))
+            last_payload = payload
+    finally:
+        for _, task in lookahead:
+            _discard(task)
 
-        descriptors.sort(
-            key=lambda d: (
-                coverage_score(d) >= 60,
-                coverage_score(d),
-                d.priority,
-            ),
-            reverse=True,
-        )
+    return last_payload, False, warnings
 
-    for descriptor in descriptors:
-        provider = registry.get(descriptor.id)
-        yield provider, descriptor
+
+async def _single_flight(
+    key: Hashable,
+    call: Callable[[], Awaitable[dict[str, Any]]],
+    *,
+    tool: str,
+) -> dict[str, Any]:
+    """Run ``call`` once for concurrent callers sharing ``key``; the rest share its outcome."""
+
+    while (pending := _IN_FLIGHT.get(key)) is not None:
+        start = perf_counter_ns()
+        # wait() never cancels the leader, even when this caller is cancelled.
+        await asyncio.wait((pending,))
+        # A cancelled leader has no outcome to share; elect a new one.
+        if not pending.cancelled():
+            # The leader recorded its own provider calls; count this caller separately.
+            status = "success" if pending.exception() is None else "error"
+            record_tool_invocation(tool, status, (perf_counter_ns() - start) / 1e9)
+            return pending.result()
+
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    _IN_FLIGHT[key] = future
+    try:
+        payload = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark it retrieved so a failure nobody waited on is not logged as unhandled.
+        future.exception()
+        raise
+    else:
+        future.set_result(payload)
+        return payload
+    finally:
+        del _IN_FLIGHT[key]
+
+
+def _cached_payload(
+    response_cache: ToolResponseCache | None, key: Hashable, tool: str
+) -> dict[str, Any] | None:
+    """Look ``key`` up, counting a hit as a served call of ``tool``."""
+
+    if response_cache is None:
+        return None
+    cached = response_cache.get(key)
+    if cached is not None:
+        # Count only: microsecond lookups would drag the latency histogram towards zero.
+        record_tool_invocation(tool, "success", None)
+    return cached
+
+
+def _cache_payload(
+    response_cache: ToolResponseCache | None,
+    key: tuple[Any, ...],
+    payload: dict[str, Any],
+) -> None:
+    # Payloads carrying warnings come from a degraded path; let the next call retry.
+    if response_cache is None or "warnings" in payload:
+        return
+    response_cache.set(key, payload)
 
 
-def _append_warnings(payload: dict[str, Any], warnings: list[str]) -> None:
+def _append_warnings(payload: dict[str, Any], warnings: ProviderWarnings) -> None:
     if not warnings:
         return
     existing = payload.setdefault("warnings", [])
-    existing.extend(warnings)
+    existing.extend(f"{provider_id}: {detail}" for provider_id, detail in warnings)
 
 
 def _descriptor_payload(descriptor: ProviderDescriptor) -> dict[str, Any]:
-    return {
-        "id": descriptor.id,
-        "name": descriptor.name,
-        "description": descriptor.description,
-        "priority": descriptor.priority,
-        "coverage_tags": list(descriptor.coverage_tags),
-        "supported_tools": list(descriptor.supported_tools),
-    }
+    return descriptor.payload
 
 
 async def _list_categories_single(
@@ -90,33 +291,28 @@ async def _list_categories_single(
     refresh: bool,
     persist_state: PersistCallable,
 ) -> dict[str, Any]:
-    start = time.perf_counter()
     warnings: list[str] = []
     source = "live"
-    status = "success"
-    try:
-        categories = await provider.list_categories(parent_id=parent_id, refresh=refresh)
-        source = getattr(provider, "_last_category_source", source)
-        await _persist(persist_state)
-    except Exception as exc:  # pragma: no cover - fallback path
-        source = "cache"
-        warnings.append(str(exc))
-        catalog = registry_state.ensure_catalog(provider.provider_id)
-        if parent_id is None:
-            categories = list(catalog.categories.values())
-        else:
-            categories = registry_state.categories_for_parent(provider.provider_id, parent_id)
-        if not categories:
-            status = "error"
-            raise
-    finally:
-        duration = time.perf_counter() - start
-        record_tool_invocation("list_categories", status, duration)
+    with _ToolTimer("list_categories"):
+        try:
+            categories = await provider.list_categories(parent_id=parent_id, refresh=refresh)
+            source = getattr(provider, "_last_category_source", source)
+            await _persist(persist_state)
+        except Exception as exc:  # pragma: no cover - fallback path
+            source = "cache"
+            warnings.append(str(exc))
+            catalog = registry_state.ensure_catalog(provider.provider_id)
+            if parent_id is None:
+                categories = list(catalog.categories.values())
+            else:
+                categories = registry_state.categories_for_parent(provider.provider_id, parent_id)
+            if not categories:
+                raise
 
     payload: dict[str, Any] = {
         "provider_id": provider.provider_id,
         "source": source,
-        "categories": [category.model_dump(mode="json") for category in categories],
+        "categories": [dump_model_json(category) for category in categories],
     }
     if warnings:
         payload["warnings"] = warnings
@@ -134,54 +330,58 @@ async def _search_services_single(
     refresh: bool,
     persist_state: PersistCallable,
 ) -> dict[str, Any]:
-    start = time.perf_counter()
     warnings: list[str] = []
     source = "live"
     requested_limit = limit if limit is not None else None
-    status = "success"
-    try:
-        results = await provider.search_services(
-            query,
-            category_id=category_id,
-            limit=requested_limit or 10,
-            offset=offset,
-            refresh=refresh,
-        )
-        source = getattr(provider, "_last_search_source", source)
-        await _persist(persist_state)
-    except Exception as exc:  # pragma: no cover - fallback path
-        source = "cache"
-        warnings.append(str(exc))
-        index = ServiceSearchIndex(registry_state, provider.provider_id)
-        catalog = registry_state.ensure_catalog(provider.provider_id)
-        fallback_limit = offset + requested_limit if requested_limit is not None else len(
-            catalog.services
-        ) or 0
-        if fallback_limit == 0:
-            fallback_limit = 100
-        cache_hits = index.search(query, limit=fallback_limit)
-        results = cache_hits[offset : offset + (requested_limit or len(cache_hits))]
-        if not results:
-            status = "error"
-            raise
-    total_results = getattr(provider, "_last_search_total", None)
-    if total_results is None:
-        total_results = offset + len(results)
-    if requested_limit is None:
-        next_offset = None
-    else:
-        next_offset = offset + len(results)
-        if next_offset >= total_results:
+    with _ToolTimer("search_services"):
+        try:
+            services = await provider.search_services(
+                query,
+                category_id=category_id,
+                limit=requested_limit or 10,
+                offset=offset,
+                refresh=refresh,
+            )
+            results = [dump_model_json(service) for service in services]
+            source = getattr(provider, "_last_search_source", source)
+            await _persist(persist_state)
+        except Exception as exc:  # pragma: no cover - fallback path
+            source = "cache"
+            warnings.append(str(exc))
+            index = registry_state.search_index(provider.provider_id)
+            if requested_limit is not None:
+                # Only the requested window is ever paged out of the hits.
+                fallback_limit = offset + requested_limit
+            else:
+                catalog_size = len(registry_state.ensure_catalog(provider.provider_id).services)
+                fallback_limit = catalog_size or 100
+            # Fuzzy scoring is CPU-bound; keep the event loop free for other requests.
+            cache_hits = await _search_index_offloaded(index, query, fallback_limit)
+            # Build result dicts straight off the hits rather than slicing out a copy
+            # of the page first; the hit list may span the whole catalog.
+            page_end = offset + requested_limit if requested_limit else None
+            results = [
+                {**dump_model_json(service), "score": score}
+                for service, score in islice(cache_hits, offset, page_end)
+            ]
+            if not results:
+                raise
+        total_results = getattr(provider, "_last_search_total", None)
+        if total_results is None:
+            total_results = offset + len(results)
+        if requested_limit is None:
             next_offset = None
+        else:
+            next_offset = offset + len(results)
+            if next_offset >= total_results:
+                next_offset = None
 
-    effective_limit = requested_limit if requested_limit is not None else len(results)
-    duration = time.perf_counter() - start
-    record_tool_invocation("search_services", status, duration)
+        effective_limit = requested_limit if requested_limit is not None else len(results)
 
     payload: dict[str, Any] = {
         "provider_id": provider.provider_id,
         "source": source,
-        "results": [result.model_dump(mode="json") for result in results],
+        "results": results,
         "limit": effective_limit,
         "offset": offset,
         "total_results": total_results,
@@ -199,23 +399,15 @@ async def _get_service_details_single(
     refresh: bool,
     persist_state: PersistCallable,
 ) -> dict[str, Any]:
-    start = time.perf_counter()
-    status = "success"
-    try:
+    with _ToolTimer("get_service_details"):
         details = await provider.get_service_details(service_id, refresh=refresh)
         source = getattr(provider, "_last_detail_source", "live")
         await _persist(persist_state)
-    except Exception:
-        status = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start
-        record_tool_invocation("get_service_details", status, duration)
 
     return {
         "provider_id": provider.provider_id,
         "source": source,
-        "service": details.model_dump(mode="json"),
+        "service": dump_model_json(details),
     }
 
 
@@ -225,23 +417,15 @@ async def _validate_service_single(
     service_id: str,
     persist_state: PersistCallable,
 ) -> dict[str, Any]:
-    start = time.perf_counter()
-    status = "success"
-    try:
+    with _ToolTimer("validate_service"):
         details = await provider.validate_service(service_id)
         source = getattr(provider, "_last_detail_source", "live")
         await _persist(persist_state)
-    except Exception:
-        status = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start
-        record_tool_invocation("validate_service", status, duration)
 
     return {
         "provider_id": provider.provider_id,
         "source": source,
-        "service": details.model_dump(mode="json"),
+        "service": dump_model_json(details),
         "validated": True,
     }
 
@@ -270,35 +454,71 @@ async def list_categories_tool(
     parent_id: str | None = None,
     refresh: bool = False,
     persist_state: PersistCallable = None,
+    response_cache: ToolResponseCache | None = None,
 ) -> dict[str, Any]:
-    aggregated_warnings: list[str] = []
-    last_payload: dict[str, Any] | None = None
-
-    for provider, _ in _provider_candidates(registry, provider_id):
-        try:
-            payload = await _list_categories_single(
-                provider,
-                registry_state,
-                parent_id=parent_id,
-                refresh=refresh,
-                persist_state=persist_state,
-            )
-        except Exception as exc:  # pragma: no cover - provider error, try next
-            aggregated_warnings.append(f"{provider.provider_id}: {exc}")
-            continue
+    cache_key = ("list_categories", provider_id, parent_id)
+    if not refresh:
+        cached = _cached_payload(response_cache, cache_key, "list_categories")
+        if cached is not None:
+            return cached
+
+    payload, populated, warnings = await _first_populated(
+        _provider_candidates(registry, provider_id),
+        lambda provider: _list_categories_single(
+            provider,
+            registry_state,
+            parent_id=parent_id,
+            refresh=refresh,
+            persist_state=persist_state,
+        ),
+        items_key="categories",
+        concurrent=not refresh,
+    )
+    if payload is not None:
+        _append_warnings(payload, warnings)
+        if populated:
+            _cache_payload(response_cache, cache_key, payload)
+        return payload
 
-        if payload["categories"]:
-            _append_warnings(payload, aggregated_warnings)
-            return payload
+    raise ProviderError("No providers returned categories")
 
-        aggregated_warnings.append(f"{provider.provider_id}: no categories returned")
-        last_payload = payload
 
-    if last_payload is not None:
-        _append_warnings(last_payload, aggregated_warnings)
-        return last_payload
+async def _search_services_uncached(
+    registry: ProviderRegistry,
+    registry_state: RegistryState,
+    cache_key: Hashable,
+    *,
+    provider_id: str | None,
+    query: str,
+    category_id: str | None,
+    limit: int | None,
+    offset: int,
+    refresh: bool,
+    persist_state: PersistCallable,
+    response_cache: ToolResponseCache | None,
+) -> dict[str, Any]:
+    payload, populated, warnings = await _first_populated(
+        _provider_candidates(registry, provider_id, query=query),
+        lambda provider: _search_services_single(
+            provider,
+            registry_state,
+            query=query,
+            category_id=category_id,
+            limit=limit,
+            offset=offset,
+            refresh=refresh,
+            persist_state=persist_state,
+        ),
+        items_key="results",
+        concurrent=not refresh,
+    )
+    if payload is not None:
+        _append_warnings(payload, warnings)
+        if populated:
+            _cache_payload(response_cache, cache_key, payload)
+        return payload
 
-    raise ProviderError("No providers returned categories")
+    raise ProviderError("No providers returned results")
 
 
 async def search_services_tool(
@@ -312,38 +532,42 @@ async def search_services_tool(
     offset: int = 0,
     refresh: bool = False,
     persist_state: PersistCallable = None,
+    response_cache: ToolResponseCache | None = None,
 ) -> dict[str, Any]:
-    aggregated_warnings: list[str] = []
-    last_payload: dict[str, Any] | None = None
-
-    for provider, _ in _provider_candidates(registry, provider_id, query=query):
-        try:
-            payload = await _search_services_single(
-                provider,
-                registry_state,
-                query=query,
-                category_id=category_id,
-                limit=limit,
-                offset=offset,
-                refresh=refresh,
-                persist_state=persist_state,
-            )
-        except Exception as exc:  # pragma: no cover - provider error, try next
-            aggregated_warnings.append(f"{provider.provider_id}: {exc}")
-            continue
-
-        if payload["results"]:
-            _append_warnings(payload, aggregated_warnings)
-            return payload
-
-        aggregated_warnings.append(f"{provider.provider_id}: no results returned")
-        last_payload = payload
-
-    if last_payload is not None:
-        _append_warnings(last_payload, aggregated_warnings)
-        return last_payload
-
-    raise ProviderError("No providers returned results")
+    # Key on the raw query: it is what providers are sent, and they may treat case
+    # or padding differently.
+    cache_key = (
+        "search_services",
+        provider_id,
+        query,
+        category_id,
+        limit,
+        offset,
+    )
+    search = partial(
+        _search_services_uncached,
+        registry,
+        registry_state,
+        cache_key,
+        provider_id=provider_id,
+        query=query,
+        category_id=category_id,
+        limit=limit,
+        offset=offset,
+        refresh=refresh,
+        persist_state=persist_state,
+        response_cache=response_cache,
+    )
+    if refresh:
+        return await search()
+    cached = _cached_payload(response_cache, cache_key, "search_services")
+    if cached is not None:
+        return cached
+
+    # Identical searches arriving while one is running share its provider calls.
+    return await _single_flight(
+        (id(registry), id(registry_state), cache_key), search, tool="search_services"
+    )
 
 
 async def get_service_details_tool(
@@ -355,7 +579,7 @@ async def get_service_details_tool(
     refresh: bool = False,
     persist_state: PersistCallable = None,
 ) -> dict[str, Any]:
-    aggregated_warnings: list[str] = []
+    aggregated_warnings: ProviderWarnings = []
 
     for provider, _ in _provider_candidates(registry, provider_id):
         try:
@@ -366,7 +590,7 @@ async def get_service_details_tool(
                 persist_state=persist_state,
             )
         except Exception as exc:
-            aggregated_warnings.append(f"{provider.provider_id}: {exc}")
+            aggregated_warnings.append((provider.provider_id, exc))
             continue
 
         _append_warnings(payload, aggregated_warnings)
@@ -385,7 +609,7 @@ async def validate_service_tool(
     service_id: str,
     persist_state: PersistCallable = None,
 ) -> dict[str, Any]:
-    aggregated_warnings: list[str] = []
+    aggregated_warnings: ProviderWarnings = []
 
     for provider, _ in _provider_candidates(registry, provider_id):
         try:
@@ -395,7 +619,7 @@ async def validate_service_tool(
                 persist_state=persist_state,
             )
         except Exception as exc:
-            aggregated_warnings.append(f"{provider.provider_id}: {exc}")
+            aggregated_warnings.append((provider.provider_id, exc))
             continue
 
         _append_warnings(payload, aggregated_warnings)
@@ -410,30 +634,20 @@ async def get_scraper_status_tool(
     *,
     provider_id: str | None = None,
 ) -> dict[str, Any]:
-    start = time.perf_counter()
-    status_label = "success"
     items: list[dict[str, Any]] = []
-    try:
+    with _ToolTimer("get_scraper_status"):
         for provider, descriptor in _provider_candidates(registry, provider_id):
             item = await _get_status_single(provider, registry_state)
             item["descriptor"] = _descriptor_payload(descriptor)
             items.append(item)
-    except Exception:
-        status_label = "error"
-        raise
-    finally:
-        duration = time.perf_counter() - start
-        record_tool_invocation("get_scraper_status", status_label, duration)
 
     return {"providers": items}
 
 
 async def list_providers_tool(registry: ProviderRegistry) -> dict[str, Any]:
-    start = time.perf_counter()
-    providers = [
-        _descriptor_payload(descriptor)
-        for descriptor in registry.ordered_descriptors()
-    ]
-    duration = time.perf_counter() - start
-    record_tool_invocation("list_providers", "success", duration)
+    with _ToolTimer("list_providers"):
+        providers = [
+            _descriptor_payload(descriptor)
+            for descriptor in registry.ordered_descriptors()
+        ]
     return {"providers": providers}
@@ -0,0 +1,254 @@
+import asyncio
+from typing import NamedTuple
+
+import httpx
+import pytest
+import pytest_asyncio
+from pydantic import AnyHttpUrl
+from starlette.applications import Starlette
+
+from server.config import Settings
+from server.live_fetch import LiveFetchClient
+from server.main import MCPServerRuntime, build_http_app
+from server.models import Category, ServiceDetails, ServiceSummary
+from server.providers import ProviderDescriptor, ProviderRegistry
+from server.providers.base import BaseProvider
+from server.registry import RegistryState
+from server.search import ServiceSearchIndex
+
+
+class DummyStore:
+    """Registry store that discards snapshots; the e2e tests never read them back."""
+
+    def write(self, data: bytes) -> None:  # pragma: no cover - simple stub
+        pass
+
+
+class StubProvider(BaseProvider):
+    provider_id = "service-public-bj"
+    display_name = "Stub Provider"
+
+    def __init__(self, settings: Settings, data):
+        super().__init__(settings)
+        self._data = data
+        self._status = {"healthy": True}
+        self._last_search_total = len(data["services"])
+        self._by_category: dict[str, list[ServiceSummary]] = {}
+        for service in data["services"]:
+            for category_id in service.category_ids:
+                self._by_category.setdefault(category_id, []).append(service)
+
+    async def initialise(self) -> None:
+        return None
+
+    async def shutdown(self) -> None:
+        return None
+
+    async def list_categories(self, parent_id=None, *, refresh: bool = False):
+        self._last_category_source = "live"
+        return self._data["categories"]
+
+    async def search_services(
+        self,
+        query,
+        *,
+        category_id=None,
+        limit=None,
+        offset=0,
+        refresh: bool = False,
+    ):
+        self._last_search_source = "live"
+        if category_id:
+            results = self._by_category.get(category_id, [])
+        else:
+            results = self._data["services"]
+        if limit is not None:
+            results = results[offset : offset + limit]
+        else:
+            results = results[offset:]
+        self._last_search_total = len(self._data["services"])
+        return results
+
+    async def get_service_details(self, service_id, *, refresh: bool = False):
+        self._last_detail_source = "live"
+        if service_id == self._data["detail"].id:
+            return self._data["detail"]
+        raise KeyError(service_id)
+
+    async def validate_service(self, service_id):
+        return await self.get_service_details(service_id, refresh=True)
+
+    async def get_status(self):
+        return self._status
+
+
+def build_stub_data():
+    return {
+        "categories": [
+            Category(
+                id="identite",
+                name="Identité",
+                url="https://example.com/identite",
+                provider_id="service-public-bj",
+            )
+        ],
+        "services": [
+            ServiceSummary.model_construct(
+                id="PS0001",
+                title="Immatriculation consulaire",
+                url=AnyHttpUrl("https://example.com/service/PS0001"),
+                provider_id="service-public-bj",
+                category_ids=["identite"],
+                excerpt="Procédure d'immatriculation",
+            )
+        ],
+        "detail": ServiceDetails.model_construct(
+            id="PS0001",
+            title="Immatriculation consulaire",
+            url=AnyHttpUrl("https://example.com/service/PS0001"),
+            provider_id="service-public-bj",
+            category_ids=["identite"],
+            summary="Résumé",
+            steps=[],
+            documents=[],
+            requirements=[],
+            costs=[],
+            contacts=[],
+        ),
+    }
+
+
+class HttpAppClient(NamedTuple):
+    client: httpx.AsyncClient
+    app: Starlette
+    runtime: MCPServerRuntime
+    transport: object
+    registry_state: RegistryState
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_app_client(tmp_path_factory):
+    """Serve the HTTP app over ASGI once per session with a stub provider registered."""
+
+    settings = Settings(
+        cache_dir=tmp_path_factory.mktemp("registry"),
+        base_url="https://example.com/",
+        enabled_providers=["service-public-bj"],
+    )
+    registry_state = RegistryState()
+    registry = ProviderRegistry()
+    stub_provider = StubProvider(settings, build_stub_data())
+    registry.register(
+        stub_provider,
+        ProviderDescriptor(
+            id=stub_provider.provider_id,
+            name=stub_provider.display_name,
+            description="Stub provider for HTTP e2e tests",
+            priority=100,
+            coverage_tags=("test",),
+            supported_tools=(
+                "list_categories",
+                "search_services",
+                "get_service_details",
+                "validate_service",
+                "get_scraper_status",
+            ),
+        ),
+    )
+    runtime = MCPServerRuntime(
+        settings=settings,
+        registry_state=registry_state,
+        registry_store=DummyStore(),
+        registry=registry,
+    )
+    app, transport = build_http_app(runtime, settings, json_response=True)
+
+    # The transport's anyio task group must be entered and exited by the same task, but
+    # fixture setup and teardown run in different ones; host the lifespan in its own.
+    started = asyncio.Event()
+    stopping = asyncio.Event()
+
+    async def serve() -> None:
+        async with app.router.lifespan_context(app):
+            started.set()
+            await stopping.wait()
+
+    server = asyncio.create_task(serve())
+    await started.wait()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        yield HttpAppClient(client, app, runtime, transport, registry_state)
+
+    stopping.set()
+    await server
+    await transport.terminate()
+    await runtime.shutdown()
+
+
+@pytest.fixture
+def http_app(http_app_client):
+    """The shared HTTP app, serving a fresh RegistryState and an empty response cache."""
+
+    registry_state = RegistryState()
+    http_app_client.runtime.registry_state = registry_state
+    http_app_client.runtime.response_cache.clear()
+    return http_app_client._replace(registry_state=registry_state)
+
+
+# (id, title, excerpt) triples for the sample search catalog.
+SAMPLE_SEARCH_SERVICES = (
+    ("svc-1", "Demande de carte d'identité", "Carte d'identité nationale"),
+    ("svc-2", "Renouvellement de passeport", None),
+)
+
+
+def build_search_index(
+    services: tuple[tuple[str, str, str | None], ...], provider_id: str = "p"
+) -> ServiceSearchIndex:
+    """Index ``services`` in a registry of their own."""
+
+    state = RegistryState()
+    state.update_services(
+        provider_id,
+        [
+            ServiceSummary(
+                id=service_id,
+                title=title,
+                url=f"https://example.com/{service_id}",
+                provider_id=provider_id,
+                excerpt=excerpt,
+            )
+            for service_id, title, excerpt in services
+        ],
+        replace=True,
+    )
+    return ServiceSearchIndex(state, provider_id)
+
+
+@pytest.fixture(scope="session")
+def sample_search_index():
+    """One index over the sample services; tests only search its immutable snapshot."""
+
+    return build_search_index(SAMPLE_SEARCH_SERVICES)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def live_fetch_client(tmp_path_factory):
+    """One LiveFetchClient (and connection pool) for every test; mock HTTP with respx."""
+
+    settings = Settings(cache_dir=tmp_path_factory.mktemp("live-fetch"))
+    http_client = httpx.AsyncClient(
+        timeout=settings.timeout_seconds,
+        headers={"User-Agent": settings.user_agent},
+        limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=15.0),
+    )
+    client = LiveFetchClient(
+        settings,
+        base_url="https://example.com/",
+        provider_id="service-public-bj",
+        client=http_client,
+    )
+    yield client
+    await client.close()
+    await http_client.aclose()
@@ -1,5 +1,4 @@
 import httpx
-import pytest
 import respx
 
 from server.config import Settings
@@ -14,7 +13,6 @@ def make_settings(tmp_path):
     )
 
 
-@pytest.mark.asyncio
 async def test_list_categories_fetches_wordpress_taxonomy(tmp_path):
     settings = make_settings(tmp_path)
     registry_state = RegistryState()
@@ -42,7 +40,6 @@ async def test_list_categories_fetches_wordpress_taxonomy(tmp_path):
     await provider.shutdown()
 
 
-@pytest.mark.asyncio
 async def test_search_services_returns_summaries(tmp_path):
     settings = make_settings(tmp_path)
     provider = FinancesBJProvider(settings, registry_state=RegistryState())
@@ -84,7 +81,6 @@ async def test_search_services_returns_summaries(tmp_path):
     await provider.shutdown()
 
 
-@pytest.mark.asyncio
 async def test_get_service_details_parses_sections(tmp_path):
     settings = make_settings(tmp_path)
     provider = FinancesBJProvider(settings, registry_state=RegistryState())
@@ -119,3 +115,21 @@ async def test_get_service_details_parses_sections(tmp_path):
     assert any(contact for contact in details.contacts if contact.label == "Structure")
     assert any(str(link.url) == "https://example.com/" for link in details.external_links)
     await provider.shutdown()
+
+
+async def test_shared_http_client_outlives_provider_shutdown(tmp_path):
+    settings = make_settings(tmp_path)
+    client = httpx.AsyncClient()
+    provider = FinancesBJProvider(settings, registry_state=RegistryState(), http_client=client)
+
+    with respx.mock(base_url="https://finances.bj") as mock:
+        route = mock.get(
+            "/wp-json/wp/v2/type_service",
+            params={"per_page": "100", "page": "1"},
+        ).mock(return_value=httpx.Response(200, json=[]))
+        await provider.list_categories()
+
+    assert route.called
+    await provider.shutdown()
+    assert not client.is_closed
+    await client.aclose()
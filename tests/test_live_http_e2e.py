@@ -1,32 +1,52 @@
-import json
 import os
+from typing import Any, TypedDict
 
 import httpx
+import orjson
 import pytest
 
 RUN_LIVE = os.getenv("RUN_LIVE_HTTP_E2E") is not None
 LIVE_URL = os.getenv("MCP_LIVE_HTTP_URL", "http://localhost:8000/mcp").rstrip("/") + "/"
 
+_BASE_HEADERS = httpx.Headers(
+    {
+        "Accept": "application/json, text/event-stream",
+        "Content-Type": "application/json",
+    }
+)
+
+
+class _RpcRequestOptional(TypedDict, total=False):
+    params: dict[str, Any]
+
+
+class RpcRequest(_RpcRequestOptional):
+    jsonrpc: str
+    id: int
+    method: str
+
+
+def rpc_request(request_id: int, method: str, params: dict[str, Any] | None = None) -> RpcRequest:
+    request: RpcRequest = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        request["params"] = params
+    return request
+
 
-@pytest.mark.asyncio
 async def test_live_http_endpoint_end_to_end() -> None:
     if not RUN_LIVE:
         pytest.skip("Set RUN_LIVE_HTTP_E2E=1 to run live HTTP e2e tests against a running server.")
 
-    headers = {
-        "Accept": "application/json, text/event-stream",
-        "Content-Type": "application/json",
-    }
     session_id: str | None = None
 
-    async def rpc(client: httpx.AsyncClient, payload: dict) -> dict:
+    async def rpc(client: httpx.AsyncClient, payload: RpcRequest) -> dict[str, Any]:
         nonlocal session_id
-        request_headers = dict(headers)
+        request_headers = _BASE_HEADERS.copy()
         if session_id:
             request_headers["MCP-Session-Id"] = session_id
         response = await client.post(
             LIVE_URL,
-            content=json.dumps(payload),
+            content=orjson.dumps(payload),
             headers=request_headers,
             follow_redirects=True,
         )
@@ -35,71 +55,64 @@ async def test_live_http_endpoint_end_to_end() -> None:
             session_id = response.headers["MCP-Session-Id"]
         content_type = response.headers.get("Content-Type", "")
         if content_type.startswith("text/event-stream"):
-            # The first SSE data line contains the JSON payload.
-            text = response.text
-            data_line = next(
-                (line for line in text.splitlines() if line.startswith("data: ")),
-                None,
-            )
-            if not data_line:
-                pytest.fail(f"Unexpected SSE payload:\n{text}")
-            body = json.loads(data_line[len("data: ") :])
+            # The first SSE data line contains the JSON payload; find it in the raw
+            # bytes rather than decoding and splitting the whole stream.
+            raw = response.content
+            start = raw.find(b"data: ")
+            if start == -1:
+                pytest.fail(f"Unexpected SSE payload:\n{response.text}")
+            start += len(b"data: ")
+            end = raw.find(b"\n", start)
+            body = orjson.loads(memoryview(raw)[start : end if end != -1 else None])
         else:
-            body = response.json()
+            body = orjson.loads(response.content)
         if "error" in body:
             pytest.fail(f"MCP error response: {body['error']}")
         return body
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
+    # One pooled client for every RPC: keep the connection alive between calls (and use
+    # HTTP/2 where the server negotiates it) instead of reconnecting per request.
+    async with httpx.AsyncClient(
+        timeout=20.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=15.0),
+    ) as client:
         try:
             initialize = await rpc(
                 client,
-                {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {
+                rpc_request(
+                    1,
+                    "initialize",
+                    {
                         "protocolVersion": "2025-06-18",
                         "capabilities": {},
                         "clientInfo": {"name": "live-e2e", "version": "0.0.0"},
                     },
-                },
+                ),
             )
         except httpx.RequestError as exc:
             pytest.skip(f"Could not reach live MCP server at {LIVE_URL}: {exc}")
 
         assert initialize["id"] == 1
 
-        list_tools = await rpc(client, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        list_tools = await rpc(client, rpc_request(2, "tools/list"))
         tool_names = {tool["name"] for tool in list_tools["result"]["tools"]}
         assert {"list_providers", "search_services", "get_scraper_status"}.issubset(tool_names)
 
         provider_listing = await rpc(
             client,
-            {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {"name": "list_providers", "arguments": {}},
-            },
+            rpc_request(3, "tools/call", {"name": "list_providers", "arguments": {}}),
         )
         providers = provider_listing["result"]["structuredContent"]["providers"]
         assert len(providers) >= 1
 
         search = await rpc(
             client,
-            {
-                "jsonrpc": "2.0",
-                "id": 4,
-                "method": "tools/call",
-                "params": {
-                    "name": "search_services",
-                    "arguments": {
-                        "query": "passeport",
-                        "limit": 5,
-                    },
-                },
-            },
+            rpc_request(
+                4,
+                "tools/call",
+                {"name": "search_services", "arguments": {"query": "passeport", "limit": 5}},
+            ),
         )
         search_payload = search["result"]["structuredContent"]
         assert "provider_id" in search_payload
@@ -107,12 +120,7 @@ async def test_live_http_endpoint_end_to_end() -> None:
 
         status = await rpc(
             client,
-            {
-                "jsonrpc": "2.0",
-                "id": 5,
-                "method": "tools/call",
-                "params": {"name": "get_scraper_status", "arguments": {}},
-            },
+            rpc_request(5, "tools/call", {"name": "get_scraper_status", "arguments": {}}),
         )
         status_payload = status["result"]["structuredContent"]
         assert isinstance(status_payload.get("providers"), list)
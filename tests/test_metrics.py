@@ -22,3 +22,16 @@ def test_metrics_payload_contains_recorded_values():
     assert "list_categories" in body
     assert "mcp_provider_fetch_total" in body
     assert "mcp_http_requests_total" in body
+
+
+def test_buffered_tool_invocations_are_flushed_on_scrape():
+    reset_metrics_for_tests()
+
+    for _ in range(300):
+        record_tool_invocation("search_services", "success", 0.01)
+    record_tool_invocation("search_services", "error", 0.02)
+
+    body = metrics_payload()[0].decode()
+    assert 'mcp_tool_calls_total{status="success",tool="search_services"} 300.0' in body
+    assert 'mcp_tool_calls_total{status="error",tool="search_services"} 1.0' in body
+    assert 'mcp_tool_latency_seconds_count{tool="search_services"} 301.0' in body
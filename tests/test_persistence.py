@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+from server.config import Settings
+from server.main import MCPServerRuntime
+from server.models import ServiceSummary
+from server.persistence import PersistScheduler
+from server.providers import ProviderRegistry
+from server.registry import RegistryState, RegistryStore
+
+
+def _service(service_id: str) -> ServiceSummary:
+    return ServiceSummary(id=service_id, title=service_id, url=f"https://example.com/{service_id}")
+
+
+async def test_flush_requests_are_coalesced():
+    calls = 0
+
+    async def persist():
+        nonlocal calls
+        calls += 1
+
+    scheduler = PersistScheduler(persist, debounce_seconds=0.01)
+    for _ in range(5):
+        await scheduler.request_flush()
+    assert calls == 0
+    assert scheduler.pending
+
+    await asyncio.sleep(0.05)
+    assert calls == 1
+    assert not scheduler.pending
+
+    await scheduler.close()
+
+
+async def test_close_waits_for_in_flight_persist_and_stops_worker():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    finished: list[bool] = []
+
+    async def persist():
+        started.set()
+        await release.wait()
+        finished.append(True)
+
+    scheduler = PersistScheduler(persist, debounce_seconds=0)
+    await scheduler.request_flush()
+    await started.wait()
+
+    closing = asyncio.create_task(scheduler.close())
+    await asyncio.sleep(0)
+    release.set()
+    await closing
+    assert finished == [True]
+
+    # Once closed, requests persist inline instead of reviving the worker.
+    await scheduler.request_flush()
+    assert finished == [True, True]
+
+
+async def test_runtime_snapshot_is_encoded_before_the_write_thread(tmp_path):
+    writing = threading.Event()
+    release = threading.Event()
+    written: list[bytes] = []
+
+    class BlockingStore:
+        def write(self, data: bytes) -> None:
+            writing.set()
+            release.wait(timeout=5)
+            written.append(data)
+
+    state = RegistryState()
+    state.update_services("p", [_service("svc-0")])
+    runtime = MCPServerRuntime(
+        settings=Settings(cache_dir=tmp_path),
+        registry_state=state,
+        registry_store=BlockingStore(),
+        registry=ProviderRegistry(),
+    )
+
+    flushing = asyncio.create_task(runtime.persist_state())
+    assert await asyncio.to_thread(writing.wait, 5)
+    # Keep mutating the catalog while the write is still pending.
+    for index in range(1, 50):
+        state.update_services("p", [_service(f"svc-{index}")])
+    release.set()
+    await flushing
+
+    snapshot = RegistryStore.decode(written[0])
+    assert list(snapshot.ensure_catalog("p").services) == ["svc-0"]
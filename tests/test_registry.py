@@ -1,9 +1,24 @@
 
-from server.models import Category, ServiceSummary
+import pytest
+
+from server.models import Category, ServiceSummary, dump_model_json
 from server.registry import RegistryState, RegistryStore, SelectorProfile
 
 
-def test_registry_updates_and_persistence(tmp_path):
+class MemoryStore:
+    """RegistryStore stand-in that keeps the encoded snapshot in memory."""
+
+    def __init__(self) -> None:
+        self._data: bytes | None = None
+
+    def save(self, state: RegistryState) -> None:
+        self._data = RegistryStore.encode(state)
+
+    def load(self) -> RegistryState | None:
+        return RegistryStore.decode(self._data) if self._data is not None else None
+
+
+def build_sample_state() -> RegistryState:
     state = RegistryState()
     categories = [
         Category(id="root", name="Root", url="https://example.com/root", provider_id="p"),
@@ -31,6 +46,11 @@ def test_registry_updates_and_persistence(tmp_path):
         "p",
         SelectorProfile(service_id="svc", css_selectors={"title": "h1"}),
     )
+    return state
+
+
+def test_registry_updates_and_persistence():
+    state = build_sample_state()
 
     children = state.categories_for_parent("p", "root")
     assert [child.id for child in children] == ["child"]
@@ -41,8 +61,33 @@ def test_registry_updates_and_persistence(tmp_path):
     svc_list = state.services_for_category("p", "child")
     assert svc_list[0].id == "svc"
 
-    store = RegistryStore(tmp_path / "registry.json")
+    store = MemoryStore()
+    assert store.load() is None
     store.save(state)
     loaded = store.load()
     assert loaded is not None
     assert "svc" in loaded.ensure_catalog("p").services
+
+
+@pytest.mark.integration
+def test_registry_store_round_trips_through_file(tmp_path):
+    store = RegistryStore(tmp_path / "registry" / "registry.json")
+    assert store.load() is None
+
+    store.save(build_sample_state())
+    loaded = store.load()
+    assert loaded is not None
+    catalog = loaded.ensure_catalog("p")
+    assert "svc" in catalog.services
+    assert catalog.selector_profiles["svc"].css_selectors == {"title": "h1"}
+
+
+def test_model_json_dump_is_reused_per_instance():
+    service = ServiceSummary(id="svc", title="Service", url="https://example.com/svc")
+
+    first = dump_model_json(service)
+    assert first == service.model_dump(mode="json")
+    assert dump_model_json(service) is first
+
+    other = service.model_copy()
+    assert dump_model_json(other) is not first
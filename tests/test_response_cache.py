@@ -0,0 +1,46 @@
+from server.config import Settings
+from server.response_cache import ToolResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ToolResponseCache(maxsize=4, ttl_seconds=10, clock=clock)
+    cache.set("key", {"value": 1})
+
+    clock.now = 9.9
+    assert cache.get("key") == {"value": 1}
+
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ToolResponseCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", {"id": "a"})
+    cache.set("b", {"id": "b"})
+    assert cache.get("a") is not None
+
+    cache.set("c", {"id": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = ToolResponseCache(maxsize=0, ttl_seconds=60)
+    cache.set("a", {"id": "a"})
+    assert len(cache) == 0
+
+
+def test_response_cache_size_reads_the_documented_env_var(monkeypatch):
+    monkeypatch.setenv("MCP_SP_RESPONSE_CACHE_SIZE", "0")
+    assert Settings(_env_file=None).response_cache_size == 0
@@ -3,27 +3,8 @@ from server.registry import RegistryState
 from server.search import ServiceSearchIndex
 
 
-def test_search_returns_ranked_results():
-    state = RegistryState()
-    services = [
-        ServiceSummary(
-            id="svc-1",
-            title="Demande de carte d'identité",
-            url="https://example.com/service1",
-            provider_id="p",
-            category_ids=["id"],
-            excerpt="Carte d'identité nationale",
-        ),
-        ServiceSummary(
-            id="svc-2",
-            title="Renouvellement de passeport",
-            url="https://example.com/service2",
-            provider_id="p",
-            category_ids=["passport"],
-        ),
-    ]
-    state.update_services("p", services, replace=True)
-    index = ServiceSearchIndex(state, "p")
+def test_search_returns_ranked_results(sample_search_index):
+    index = sample_search_index
 
     results = index.search("carte identite")
     assert results
@@ -33,3 +14,75 @@ def test_search_returns_ranked_results():
     # ensure fuzzy fallback works
     fuzzy_results = index.search("passeport")
     assert any(result.id == "svc-2" for result in fuzzy_results)
+
+
+def test_search_fuzzy_fallback_scores_partial_titles():
+    state = RegistryState()
+    state.update_services(
+        "p",
+        [
+            ServiceSummary(
+                id="svc-1",
+                title="Renouvellement de passeport biométrique",
+                url="https://example.com/service1",
+                provider_id="p",
+            ),
+            ServiceSummary(
+                id="svc-2",
+                title="Casier judiciaire",
+                url="https://example.com/service2",
+                provider_id="p",
+            ),
+        ],
+        replace=True,
+    )
+    index = ServiceSearchIndex(state, "p")
+
+    # no token matches "passepor", so every title goes through the fuzzy scorer
+    results = index.search("passepor")
+    assert results
+    assert results[0].id == "svc-1"
+    assert results[0].score is not None and results[0].score >= 80
+
+
+def test_registry_search_index_is_shared_and_refreshed_on_lookup():
+    state = RegistryState()
+    index = state.search_index("p")
+    assert state.search_index("p") is index
+    assert index.search("passeport") == []
+
+    state.update_services(
+        "p",
+        [
+            ServiceSummary(
+                id="svc-2",
+                title="Renouvellement de passeport",
+                url="https://example.com/service2",
+                provider_id="p",
+            )
+        ],
+    )
+    # The old snapshot stays put until the index is looked up again on the loop.
+    assert index.search("passeport") == []
+    assert state.search_index("p") is index
+    assert [result.id for result in index.search("passeport")] == ["svc-2"]
+
+
+def test_search_with_scores_reads_the_last_built_snapshot():
+    state = RegistryState()
+    passport = ServiceSummary(
+        id="svc-1",
+        title="Passeport",
+        url="https://example.com/service1",
+        provider_id="p",
+    )
+    state.update_services("p", [passport], replace=True)
+    index = state.search_index("p")
+
+    # Replacing the catalog must not leak into a search until the index is refreshed on
+    # the loop; worker-thread searches rely on that.
+    state.update_services("p", [passport.model_copy(update={"id": "svc-2"})], replace=True)
+    assert [service.id for service, _ in index.search_with_scores("passeport")] == ["svc-1"]
+
+    state.search_index("p")
+    assert [service.id for service, _ in index.search_with_scores("passeport")] == ["svc-2"]
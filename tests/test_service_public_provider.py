@@ -1,37 +1,94 @@
-import json
-
+import orjson
 import pytest
+import pytest_asyncio
 
 from server.config import Settings
+from server.live_fetch import build_http_client
 from server.providers.service_public_bj import ServicePublicBJProvider
 
 
+def _search_payload(count):
+    return orjson.dumps(
+        {
+            "services": [
+                {
+                    "id": f"PS{i:04d}",
+                    "name": f"Service {i}",
+                    "description": "desc",
+                    "categories": ["Affaires"],
+                }
+                for i in range(count)
+            ]
+        }
+    ).decode()
+
+
+_SEARCH_URL = "https://example.com/api/portal/publicservices/search?query=test"
+# Search responses shared by the pagination tests, serialised once at import.
+_SEARCH_20 = _search_payload(20)
+_SEARCH_15 = _search_payload(15)
+
+
 class StubFetcher:
+    base_url = "https://example.com/"
+
     def __init__(self, mapping):
-        self.mapping = mapping
+        # Index each response under its absolute and base-relative URL up front so
+        # fetch_text is a single lookup.
+        self._responses = {}
+        for url, text in mapping.items():
+            self.add(url, text)
+
+    def add(self, url, text):
+        self._responses[url] = text
+        self._responses[url.removeprefix(self.base_url)] = text
+
+    def remove(self, url):
+        self._responses.pop(url, None)
+        self._responses.pop(url.removeprefix(self.base_url), None)
 
     async def fetch_text(self, url, *, use_cache=True):
-        if url in self.mapping:
-            return self.mapping[url]
-        if not url.startswith("http"):
-            absolute = f"https://example.com/{url.lstrip('/')}"
-            if absolute in self.mapping:
-                return self.mapping[absolute]
-        raise AssertionError(f"Unexpected URL requested: {url}")
+        try:
+            return self._responses[url]
+        except KeyError:
+            raise AssertionError(f"Unexpected URL requested: {url}") from None
 
     async def close(self):
         return None
 
 
-@pytest.mark.asyncio
-async def test_list_categories_uses_api(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
-    provider._fetcher = StubFetcher(
+@pytest_asyncio.fixture(scope="module")
+async def provider_settings_and_client(tmp_path_factory):
+    """Share the settings and one httpx pool; the providers themselves are built per test."""
+
+    settings = Settings(cache_dir=tmp_path_factory.mktemp("cache"), base_url="https://example.com/")
+    client = build_http_client(settings)
+    yield settings, client
+    await client.aclose()
+
+
+@pytest_asyncio.fixture
+async def provider_factory(provider_settings_and_client):
+    settings, client = provider_settings_and_client
+    live_fetchers = []
+
+    def make(mapping):
+        provider = ServicePublicBJProvider(settings, http_client=client)
+        live_fetchers.append(provider._fetcher)
+        provider._fetcher = StubFetcher(mapping)
+        return provider
+
+    yield make
+    for fetcher in live_fetchers:
+        await fetcher.close()
+
+
+async def test_list_categories_uses_api(provider_factory):
+    provider = provider_factory(
         {
-            "https://example.com/api/portal/publicservices/?categories=true": json.dumps(
+            "https://example.com/api/portal/publicservices/?categories=true": orjson.dumps(
                 {"services": [], "categories": ["", "Affaires", "Economie"]}
-            )
+            ).decode()
         }
     )
 
@@ -40,13 +97,10 @@ async def test_list_categories_uses_api(tmp_path):
     assert str(categories[0].url).endswith("/public/services?category=affaires")
 
 
-@pytest.mark.asyncio
-async def test_search_services_returns_results(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
-    provider._fetcher = StubFetcher(
+async def test_search_services_returns_results(provider_factory):
+    provider = provider_factory(
         {
-            "https://example.com/api/portal/publicservices/search?query=test": json.dumps(
+            "https://example.com/api/portal/publicservices/search?query=test": orjson.dumps(
                 {
                     "services": [
                         {
@@ -57,7 +111,7 @@ async def test_search_services_returns_results(tmp_path):
                         }
                     ]
                 }
-            )
+            ).decode()
         }
     )
 
@@ -70,13 +124,10 @@ async def test_search_services_returns_results(tmp_path):
     assert str(summary.url).endswith("/public/services/service/PS0001")
 
 
-@pytest.mark.asyncio
-async def test_get_service_details_parses_payload(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
-    provider._fetcher = StubFetcher(
+async def test_get_service_details_parses_payload(provider_factory):
+    provider = provider_factory(
         {
-            "https://example.com/api/portal/publicservices/PS0001": json.dumps(
+            "https://example.com/api/portal/publicservices/PS0001": orjson.dumps(
                 {
                     "id": "PS0001",
                     "name": "Renouvellement carte",
@@ -102,7 +153,7 @@ async def test_get_service_details_parses_payload(tmp_path):
                         "delayTime": "48h",
                     },
                 }
-            )
+            ).decode()
         }
     )
 
@@ -117,12 +168,9 @@ async def test_get_service_details_parses_payload(tmp_path):
     assert any(contact.value == "Agence X" for contact in details.contacts)
 
 
-@pytest.mark.asyncio
-async def test_get_service_details_uses_cache(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
+async def test_get_service_details_uses_cache(provider_factory):
     detail_url = "https://example.com/api/portal/publicservices/PS0001"
-    payload = json.dumps(
+    payload = orjson.dumps(
         {
             "id": "PS0001",
             "name": "Renouvellement carte",
@@ -131,67 +179,35 @@ async def test_get_service_details_uses_cache(tmp_path):
             "mServiceForms": [],
             "mService": {},
         }
-    )
-    provider._fetcher = StubFetcher({detail_url: payload})
+    ).decode()
+    provider = provider_factory({detail_url: payload})
 
     details = await provider.get_service_details("PS0001")
     assert details
-    provider._fetcher.mapping.pop(detail_url, None)
+    provider._fetcher.remove(detail_url)
     cached = await provider.get_service_details("PS0001")
     assert cached
     assert provider._last_detail_source == "cache"
 
-    provider._fetcher.mapping[detail_url] = payload
+    provider._fetcher.add(detail_url, payload)
     refreshed = await provider.get_service_details("PS0001", refresh=True)
     assert refreshed
     assert provider._last_detail_source == "live"
 
 
-@pytest.mark.asyncio
-async def test_search_services_respects_offset(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
-    search_url = "https://example.com/api/portal/publicservices/search?query=test"
-    payload = json.dumps(
-        {
-            "services": [
-                {
-                    "id": f"PS{i:04d}",
-                    "name": f"Service {i}",
-                    "description": "desc",
-                    "categories": ["Affaires"],
-                }
-                for i in range(20)
-            ]
-        }
-    )
-    provider._fetcher = StubFetcher({search_url: payload})
+@pytest.fixture
+def paginated_provider(provider_factory):
+    return provider_factory({_SEARCH_URL: _SEARCH_20})
 
-    first_batch = await provider.search_services("test", limit=5, offset=0)
-    second_batch = await provider.search_services("test", limit=5, offset=5)
-    assert first_batch[0].id == "PS0000"
-    assert second_batch[0].id == "PS0005"
 
+@pytest.mark.parametrize(("offset", "expected_id"), [(0, "PS0000"), (5, "PS0005")])
+async def test_search_services_respects_offset(paginated_provider, offset, expected_id):
+    results = await paginated_provider.search_services("test", limit=5, offset=offset)
+    assert results[0].id == expected_id
 
-@pytest.mark.asyncio
-async def test_search_services_without_limit_returns_all(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com/")
-    provider = ServicePublicBJProvider(settings)
-    search_url = "https://example.com/api/portal/publicservices/search?query=test"
-    payload = json.dumps(
-        {
-            "services": [
-                {
-                    "id": f"PS{i:04d}",
-                    "name": f"Service {i}",
-                    "description": "desc",
-                    "categories": ["Affaires"],
-                }
-                for i in range(15)
-            ]
-        }
-    )
-    provider._fetcher = StubFetcher({search_url: payload})
+
+async def test_search_services_without_limit_returns_all(provider_factory):
+    provider = provider_factory({_SEARCH_URL: _SEARCH_15})
 
     results = await provider.search_services("test")
     assert len(results) == 15
@@ -1,4 +1,6 @@
 import asyncio
+from contextlib import suppress
+from itertools import islice
 
 import pytest
 from anyio import create_memory_object_stream
@@ -13,9 +15,77 @@ from server.providers.base import BaseProvider
 from server.registry import RegistryState
 
 
+def _rpc(request_id, method, params=None):
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        request["params"] = params
+    return SessionMessage(types.JSONRPCMessage.model_validate(request))
+
+
+def _tool_call(request_id, name, arguments=None):
+    return _rpc(request_id, "tools/call", {"name": name, "arguments": arguments or {}})
+
+
+# The e2e requests are fixed, so validate them into messages once at import.
+_INITIALIZE = _rpc(
+    1,
+    "initialize",
+    {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "0.0.0"},
+    },
+)
+_LIST_TOOLS = _rpc(2, "tools/list")
+_LIST_CATEGORIES = _tool_call(3, "list_categories")
+_SEARCH_SERVICES = _tool_call(4, "search_services", {"query": "immatriculation"})
+_LIST_PROVIDERS = _tool_call(5, "list_providers")
+_SCRAPER_STATUS = _tool_call(6, "get_scraper_status")
+
+
+# Settings template; the test only swaps in its tmp cache_dir.
+_BASE_SETTINGS = Settings(base_url="https://example.com/")
+
+
+# Read-only stub catalogue, validated once at import.
+_STUB_DATA = {
+    "categories": [
+        Category(
+            id="identite",
+            name="Identité",
+            url="https://example.com/identite",
+            provider_id="service-public-bj",
+        )
+    ],
+    "services": [
+        ServiceSummary(
+            id="PS001",
+            title="Immatriculation consulaire",
+            url="https://example.com/service/PS001",
+            provider_id="service-public-bj",
+            category_ids=["identite"],
+            excerpt="Procédure",
+        )
+    ],
+    "detail": ServiceDetails(
+        id="PS001",
+        title="Immatriculation consulaire",
+        url="https://example.com/service/PS001",
+        provider_id="service-public-bj",
+        category_ids=["identite"],
+        summary="Résumé",
+        steps=[],
+        documents=[],
+        requirements=[],
+        costs=[],
+        contacts=[],
+    ),
+}
+
+
 class FakeStore:
-    def save(self, state):  # pragma: no cover - simple stub
-        self.state = state
+    def write(self, data):  # pragma: no cover - simple stub
+        pass
 
 
 class StdioStubProvider(BaseProvider):
@@ -26,6 +96,7 @@ class StdioStubProvider(BaseProvider):
         super().__init__(settings)
         self._data = data
         self._status = {"healthy": True}
+        self._titles_lowered = tuple((svc.title.lower(), svc) for svc in data["services"])
 
     async def initialise(self):  # pragma: no cover
         return None
@@ -39,8 +110,9 @@ class StdioStubProvider(BaseProvider):
 
     async def search_services(self, query, *, category_id=None, limit=None, offset=0, refresh=False):
         self._last_search_source = "live"
-        services = [svc for svc in self._data["services"] if query.lower() in svc.title.lower()]
-        return services[offset : offset + limit] if limit else services[offset:]
+        lowered = query.lower()
+        matches = (svc for title, svc in self._titles_lowered if lowered in title)
+        return list(islice(matches, offset, offset + limit if limit else None))
 
     async def get_service_details(self, service_id, *, refresh=False):
         self._last_detail_source = "live"
@@ -55,46 +127,11 @@ class StdioStubProvider(BaseProvider):
         return self._status
 
 
-@pytest.mark.asyncio
 async def test_stdio_runtime_end_to_end(tmp_path):
-    settings = Settings(cache_dir=tmp_path / "registry", base_url="https://example.com/")
-    data = {
-        "categories": [
-            Category(
-                id="identite",
-                name="Identité",
-                url="https://example.com/identite",
-                provider_id="service-public-bj",
-            )
-        ],
-        "services": [
-            ServiceSummary(
-                id="PS001",
-                title="Immatriculation consulaire",
-                url="https://example.com/service/PS001",
-                provider_id="service-public-bj",
-                category_ids=["identite"],
-                excerpt="Procédure",
-            )
-        ],
-        "detail": ServiceDetails(
-            id="PS001",
-            title="Immatriculation consulaire",
-            url="https://example.com/service/PS001",
-            provider_id="service-public-bj",
-            category_ids=["identite"],
-            summary="Résumé",
-            steps=[],
-            documents=[],
-            requirements=[],
-            costs=[],
-            contacts=[],
-        ),
-    }
-
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path / "registry"})
     registry_state = RegistryState()
     registry = ProviderRegistry()
-    stdio_provider = StdioStubProvider(settings, data)
+    stdio_provider = StdioStubProvider(settings, _STUB_DATA)
     registry.register(
         stdio_provider,
         ProviderDescriptor(
@@ -120,88 +157,62 @@ async def test_stdio_runtime_end_to_end(tmp_path):
         registry=registry,
     )
 
-    read_writer, read_stream = create_memory_object_stream[SessionMessage | Exception](0)
-    write_stream, write_reader = create_memory_object_stream[SessionMessage](0)
+    # Buffered so a send does not have to rendezvous with the receiver; the exchange is
+    # request/response, so at most a handful of messages are ever queued.
+    read_writer, read_stream = create_memory_object_stream[SessionMessage | Exception](16)
+    write_stream, write_reader = create_memory_object_stream[SessionMessage](16)
+
+    # Responses can arrive out of order once requests overlap, so a single reader
+    # routes each one to the caller waiting on its id.
+    pending: dict[int, asyncio.Future[dict]] = {}
 
-    async def send(request):
-        message = types.JSONRPCMessage.model_validate(request)
-        await read_writer.send(SessionMessage(message))
-        response = await write_reader.receive()
-        return response.message.model_dump()
+    async def read_responses():
+        async for response in write_reader:
+            payload = response.message.model_dump()
+            future = pending.pop(payload.get("id"), None)
+            if future is not None:
+                future.set_result(payload)
+
+    async def send(message):
+        future = asyncio.get_running_loop().create_future()
+        pending[message.message.root.id] = future
+        await read_writer.send(message)
+        return await future
 
     async def run_session():
         await runtime.run_session(read_stream, write_stream)
 
     task = asyncio.create_task(run_session())
+    reader = asyncio.create_task(read_responses())
 
     try:
-        initialize = await send(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2025-06-18",
-                    "capabilities": {},
-                    "clientInfo": {"name": "test", "version": "0.0.0"},
-                },
-            }
-        )
+        initialize = await send(_INITIALIZE)
         assert initialize["result"] is not None
 
-        list_tools = await send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        list_tools = await send(_LIST_TOOLS)
         tool_names = {tool["name"] for tool in list_tools["result"]["tools"]}
         assert {"list_providers", "search_services"}.issubset(tool_names)
 
-        providers_listing = await send(
-            {
-                "jsonrpc": "2.0",
-                "id": 5,
-                "method": "tools/call",
-                "params": {"name": "list_providers", "arguments": {}},
-            }
+        providers_listing, categories_msg, search_msg, status_msg = await asyncio.gather(
+            send(_LIST_PROVIDERS),
+            send(_LIST_CATEGORIES),
+            send(_SEARCH_SERVICES),
+            send(_SCRAPER_STATUS),
         )
         assert providers_listing["result"]["structuredContent"]["providers"][0]["id"] == "service-public-bj"
-
-        categories_msg = await send(
-            {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {"name": "list_categories", "arguments": {}},
-            }
-        )
         assert (
             categories_msg["result"]["structuredContent"]["categories"][0]["id"] == "identite"
         )
-
-        search_msg = await send(
-            {
-                "jsonrpc": "2.0",
-                "id": 4,
-                "method": "tools/call",
-                "params": {
-                    "name": "search_services",
-                    "arguments": {"query": "immatriculation"},
-                },
-            }
-        )
         assert search_msg["result"]["structuredContent"]["results"][0]["id"] == "PS001"
-
-        status_msg = await send(
-            {
-                "jsonrpc": "2.0",
-                "id": 6,
-                "method": "tools/call",
-                "params": {"name": "get_scraper_status", "arguments": {}},
-            }
-        )
         assert (
             status_msg["result"]["structuredContent"]["providers"][0]["provider_id"]
             == "service-public-bj"
         )
 
     finally:
+        reader.cancel()
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
+        with suppress(asyncio.CancelledError):
+            await reader
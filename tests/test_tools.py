@@ -1,10 +1,15 @@
+import asyncio
+
 import pytest
 
+from server import tools
 from server.config import Settings
+from server.metrics import metrics_payload, reset_metrics_for_tests
 from server.models import Category, ServiceDetails, ServiceSummary
 from server.providers import ProviderDescriptor, ProviderRegistry
 from server.providers.base import BaseProvider
 from server.registry import RegistryState
+from server.response_cache import ToolResponseCache
 from server.tools import (
     get_scraper_status_tool,
     get_service_details_tool,
@@ -14,6 +19,33 @@ from server.tools import (
     validate_service_tool,
 )
 
+# Validated once; tests copy it with their own cache_dir (model_copy skips validation).
+_BASE_SETTINGS = Settings(base_url="https://example.com")
+
+
+def _dummy_models(provider_id: str) -> tuple[Category, ServiceSummary, ServiceDetails]:
+    category = Category(
+        id="cat",
+        name="Category",
+        url="https://example.com/cat",
+        provider_id=provider_id,
+    )
+    summary = ServiceSummary(
+        id="svc",
+        title="Service",
+        url="https://example.com/svc",
+        provider_id=provider_id,
+        category_ids=["cat"],
+    )
+    details = ServiceDetails(
+        id="svc",
+        title="Service",
+        url="https://example.com/svc",
+        provider_id=provider_id,
+        category_ids=["cat"],
+    )
+    return category, summary, details
+
 
 class DummyProvider(BaseProvider):
     provider_id = "dummy"
@@ -21,20 +53,14 @@ class DummyProvider(BaseProvider):
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
+        self._category, self._summary, self._details = _dummy_models(self.provider_id)
 
     async def initialise(self):
         return None
 
     async def list_categories(self, parent_id=None, *, refresh: bool = False):
         self._last_category_source = "live"
-        return [
-            Category(
-                id="cat",
-                name="Category",
-                url="https://example.com/cat",
-                provider_id=self.provider_id,
-            )
-        ]
+        return [self._category]
 
     async def search_services(
         self,
@@ -46,24 +72,13 @@ class DummyProvider(BaseProvider):
         refresh: bool = False,
     ):
         self._last_search_source = "live"
-        return [
-            ServiceSummary(
-                id="svc",
-                title="Service",
-                url="https://example.com/svc",
-                provider_id=self.provider_id,
-                category_ids=["cat"],
-            )
-        ]
+        return [self._summary]
 
     async def get_service_details(self, service_id, *, refresh: bool = False):
         self._last_detail_source = "live"
-        return ServiceDetails(
-            id=service_id,
-            title="Service",
-            url="https://example.com/svc",
-            provider_id=self.provider_id,
-            category_ids=["cat"],
+        details = self._details
+        return (
+            details if service_id == details.id else details.model_copy(update={"id": service_id})
         )
 
     async def validate_service(self, service_id):
@@ -73,9 +88,11 @@ class DummyProvider(BaseProvider):
         return {"provider_id": self.provider_id, "healthy": True}
 
 
-@pytest.mark.asyncio
-async def test_tool_routing(tmp_path):
-    settings = Settings(cache_dir=tmp_path, base_url="https://example.com")
+@pytest.fixture(scope="module")
+def dummy_bundle(tmp_path_factory):
+    """A registry wired to one DummyProvider, shared by the tests that only read it."""
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path_factory.mktemp("tools")})
     registry = ProviderRegistry()
     provider = DummyProvider(settings)
     registry.register(
@@ -95,7 +112,16 @@ async def test_tool_routing(tmp_path):
             ),
         ),
     )
-    registry_state = RegistryState()
+    return registry, provider
+
+
+@pytest.fixture
+def registry_state():
+    return RegistryState()
+
+
+async def test_tool_routing(dummy_bundle, registry_state):
+    registry, _ = dummy_bundle
 
     persist_calls = {"count": 0}
 
@@ -147,5 +173,195 @@ async def test_tool_routing(tmp_path):
 
     providers_listing = await list_providers_tool(registry)
     assert providers_listing["providers"][0]["id"] == "dummy"
+    assert providers_listing["providers"][0] is registry.get_descriptor("dummy").payload
 
     assert persist_calls["count"] == 4
+
+
+def test_provider_resolution_tracks_registrations(tmp_path):
+    class SecondaryProvider(DummyProvider):
+        provider_id = "secondary"
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path})
+    registry = ProviderRegistry()
+    registry.register(
+        DummyProvider(settings),
+        ProviderDescriptor(id="dummy", name="Dummy", description="", priority=10),
+    )
+    first = registry.resolve()
+    assert registry.resolve() is first
+    ordered = registry.ordered_descriptors()
+    assert registry.ordered_descriptors() is ordered
+    assert [descriptor.id for _, descriptor in first] == ["dummy"]
+
+    generation = registry.generation
+    registry.register(
+        SecondaryProvider(settings),
+        ProviderDescriptor(id="secondary", name="Secondary", description="", priority=90),
+    )
+    assert registry.generation > generation
+    assert [descriptor.id for _, descriptor in registry.resolve()] == ["secondary", "dummy"]
+    assert [descriptor.id for descriptor in registry.ordered_descriptors()] == [
+        "secondary",
+        "dummy",
+    ]
+    assert [descriptor.id for _, descriptor in registry.resolve("dummy")] == ["dummy"]
+
+
+async def test_search_routes_by_coverage_tags(tmp_path, registry_state):
+    class FinanceProvider(DummyProvider):
+        provider_id = "finance"
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path})
+    registry = ProviderRegistry()
+    registry.register(
+        DummyProvider(settings),
+        ProviderDescriptor(
+            id="dummy", name="Dummy", description="", priority=100, coverage_tags=("Passeport",)
+        ),
+    )
+    registry.register(
+        FinanceProvider(settings),
+        ProviderDescriptor(
+            id="finance", name="Finance", description="", priority=10, coverage_tags=("Impots",)
+        ),
+    )
+
+    routed = await search_services_tool(registry, registry_state, query="impots")
+    assert routed["provider_id"] == "finance"
+
+    shouted = await search_services_tool(registry, registry_state, query="  IMPOTS ")
+    assert shouted["provider_id"] == "finance"
+
+    default = await search_services_tool(registry, registry_state, query="xyz")
+    assert default["provider_id"] == "dummy"
+
+
+async def test_search_responses_are_cached(tmp_path, registry_state):
+    class CountingProvider(DummyProvider):
+        calls = 0
+
+        async def search_services(self, query, **kwargs):
+            CountingProvider.calls += 1
+            return await super().search_services(query, **kwargs)
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path})
+    registry = ProviderRegistry()
+    registry.register(
+        CountingProvider(settings),
+        ProviderDescriptor(id="dummy", name="Dummy", description=""),
+    )
+    cache = ToolResponseCache(maxsize=8, ttl_seconds=60)
+    reset_metrics_for_tests()
+
+    first = await search_services_tool(
+        registry, registry_state, query="Passeport", response_cache=cache
+    )
+    second = await search_services_tool(
+        registry, registry_state, query="Passeport", response_cache=cache
+    )
+    assert second is first
+    assert CountingProvider.calls == 1
+    # Cache hits still count as served calls...
+    body = metrics_payload()[0].decode()
+    assert 'mcp_tool_calls_total{status="success",tool="search_services"} 2.0' in body
+    # ...but only the provider call is timed.
+    assert 'mcp_tool_latency_seconds_count{tool="search_services"} 1.0' in body
+
+    # Providers see the raw query, so a variant of it is its own cache entry.
+    await search_services_tool(registry, registry_state, query=" passeport ", response_cache=cache)
+    assert CountingProvider.calls == 2
+
+    await search_services_tool(
+        registry, registry_state, query="Passeport", refresh=True, response_cache=cache
+    )
+    assert CountingProvider.calls == 3
+
+
+async def test_search_hedges_slow_provider_with_fallback(tmp_path, registry_state, monkeypatch):
+    monkeypatch.setattr(tools, "_HEDGE_DELAY_SECONDS", 0.01)
+    started: list[str] = []
+    overlapped: list[bool] = []
+
+    class SlowEmptyProvider(DummyProvider):
+        delay = 0.0
+
+        async def search_services(self, query, **kwargs):
+            started.append(self.provider_id)
+            await asyncio.sleep(self.delay)
+            overlapped.append("backup" in started)
+            return []
+
+    class BackupProvider(DummyProvider):
+        provider_id = "backup"
+
+        async def search_services(self, query, **kwargs):
+            started.append(self.provider_id)
+            return await super().search_services(query, **kwargs)
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path})
+    primary = SlowEmptyProvider(settings)
+    registry = ProviderRegistry()
+    registry.register(
+        primary,
+        ProviderDescriptor(id="dummy", name="Dummy", description="", priority=100),
+    )
+    registry.register(
+        BackupProvider(settings),
+        ProviderDescriptor(id="backup", name="Backup", description="", priority=10),
+    )
+
+    # A primary answering within the hedge delay is never doubled up.
+    result = await search_services_tool(registry, registry_state, query="test")
+    assert result["provider_id"] == "backup"
+    assert result["warnings"] == ["dummy: no results returned"]
+    assert overlapped == [False]
+
+    # A slow primary gets the fallback started alongside it.
+    primary.delay = 0.05
+    started.clear()
+    result = await search_services_tool(registry, registry_state, query="test")
+    assert result["provider_id"] == "backup"
+    assert overlapped == [False, True]
+
+    # Refreshes stay sequential: the fallback only starts once the primary is empty.
+    started.clear()
+    refreshed = await search_services_tool(registry, registry_state, query="test", refresh=True)
+    assert refreshed["provider_id"] == "backup"
+    assert overlapped == [False, True, False]
+
+
+async def test_search_cache_fallback_pages_requested_window(tmp_path, registry_state):
+    class OfflineProvider(DummyProvider):
+        async def search_services(self, query, **kwargs):
+            raise RuntimeError("offline")
+
+    settings = _BASE_SETTINGS.model_copy(update={"cache_dir": tmp_path})
+    registry = ProviderRegistry()
+    registry.register(
+        OfflineProvider(settings),
+        ProviderDescriptor(id="dummy", name="Dummy", description=""),
+    )
+    registry_state.update_services(
+        "dummy",
+        [
+            ServiceSummary(
+                id=f"svc-{index}",
+                title=title,
+                url=f"https://example.com/svc-{index}",
+                provider_id="dummy",
+            )
+            for index, title in enumerate(
+                ["Passeport urgent express", "Passeport urgent", "Passeport"]
+            )
+        ],
+    )
+
+    page = await search_services_tool(
+        registry, registry_state, query="passeport urgent express", limit=1, offset=1
+    )
+    assert page["source"] == "cache"
+    assert [result["id"] for result in page["results"]] == ["svc-1"]
+
+    everything = await search_services_tool(registry, registry_state, query="passeport")
+    assert len(everything["results"]) == 3